@@ -3,17 +3,20 @@
 from .models import Card, SignupBonus, Credit, CardData, CreditUsage, RetentionOffer, ProductChange
 from .storage import CardStorage
 from .web_storage import WebStorage, init_web_storage, save_web, sync_to_localstorage
-from .preprocessor import preprocess_text, get_char_reduction
+from .preprocessor import preprocess_text, filter_markdown_sections, get_char_reduction
 from .fetcher import fetch_card_page, get_allowed_domains
-from .pipeline import extract_from_url, extract_from_text
+from .pipeline import extract_from_url, extract_from_urls, extract_from_text
 from .library import CardTemplate, get_all_templates, get_template, get_template_choices
 from .normalize import normalize_issuer, simplify_card_name, get_display_name, match_to_library_template
 from .periods import (
+    FREQUENCY_MULTIPLIERS,
     get_current_period,
     get_period_display_name,
     is_credit_used_this_period,
+    is_credit_used_in_period,
     is_reminder_snoozed,
     get_unused_credits_count,
+    get_credits_stats,
     mark_credit_used,
     mark_credit_unused,
     snooze_credit_reminder,
@@ -48,6 +51,7 @@ from .demo import get_demo_cards, get_demo_summary
 from .ai_rate_limit import (
     check_extraction_limit,
     record_extraction,
+    record_extractions_bulk,
     get_extraction_count,
     get_extraction_history,
     get_usage_display,
@@ -73,6 +77,7 @@ __all__ = [
     "sync_to_localstorage",
     # Extraction pipeline (main API)
     "extract_from_url",
+    "extract_from_urls",
     "extract_from_text",
     # Card library
     "get_all_templates",
@@ -84,11 +89,14 @@ __all__ = [
     "get_display_name",
     "match_to_library_template",
     # Period/benefit tracking
+    "FREQUENCY_MULTIPLIERS",
     "get_current_period",
     "get_period_display_name",
     "is_credit_used_this_period",
+    "is_credit_used_in_period",
     "is_reminder_snoozed",
     "get_unused_credits_count",
+    "get_credits_stats",
     "mark_credit_used",
     "mark_credit_unused",
     "snooze_credit_reminder",
@@ -98,6 +106,7 @@ __all__ = [
     "fetch_card_page",
     "get_allowed_domains",
     "preprocess_text",
+    "filter_markdown_sections",
     "get_char_reduction",
     # Importer
     "SpreadsheetImporter",
@@ -132,6 +141,7 @@ __all__ = [
     # AI rate limiting
     "check_extraction_limit",
     "record_extraction",
+    "record_extractions_bulk",
     "get_extraction_count",
     "get_extraction_history",
     "get_usage_display",
@@ -266,6 +266,67 @@ def record_extraction(
     return extraction_id
 
 
+def record_extractions_bulk(
+    user_id: UUID,
+    count: int,
+    model: str = "",
+    extraction_type: str = "url",
+    success: bool = True
+) -> list:
+    """Record several AI extractions at once.
+
+    Same bookkeeping as calling record_extraction() count times, but the
+    counter upsert and the usage log rows each go out as one statement.
+
+    Args:
+        user_id: User's UUID
+        count: Number of extractions to record
+        model: Model used (e.g., "gemini-2.5-flash", "claude-sonnet-4")
+        extraction_type: Type of extraction ("url", "xlsx")
+        success: Whether extractions succeeded
+
+    Returns:
+        List of extraction IDs for reference
+    """
+    if count <= 0:
+        return []
+
+    month_key = get_current_month_key()
+    day_key = get_current_day_key()
+    extraction_ids = [str(uuid4())[:8] for _ in range(count)]
+
+    with get_cursor() as cursor:
+        # Update daily/monthly count by the whole batch
+        cursor.execute(
+            """
+            INSERT INTO ai_extractions (user_id, month_key, day_key, extraction_count, last_extracted_at)
+            VALUES (%s, %s, %s, %s, CURRENT_TIMESTAMP)
+            ON CONFLICT (user_id, day_key)
+            DO UPDATE SET
+                extraction_count = ai_extractions.extraction_count + EXCLUDED.extraction_count,
+                last_extracted_at = CURRENT_TIMESTAMP
+            """,
+            (str(user_id), month_key, day_key, count)
+        )
+
+        # One log row per extraction (no PII)
+        cursor.execute(
+            """
+            INSERT INTO ai_extraction_logs (
+                extraction_id, user_id, month_key, day_key,
+                input_tokens, output_tokens, model, extraction_type,
+                success, created_at
+            )
+            SELECT extraction_id, %s, %s, %s, 0, 0, %s, %s, %s, CURRENT_TIMESTAMP
+            FROM unnest(%s::text[]) AS extraction_id
+            """,
+            (str(user_id), month_key, day_key,
+             model, extraction_type, success, extraction_ids)
+        )
+
+    return extraction_ids
+
+
 def get_extraction_history(user_id: UUID, months: int = 3) -> list:
     """Get extraction history for user.
     
@@ -1,5 +1,7 @@
 """Authentication service for ChurnPilot."""
 
+import logging
+import os
 import re
 import secrets
 from datetime import datetime, timedelta
@@ -10,6 +12,8 @@ import bcrypt
 from .database import get_cursor
 from .models import User
 
+logger = logging.getLogger(__name__)
+
 
 # Minimum password length
 MIN_PASSWORD_LENGTH = 8
@@ -18,10 +22,34 @@ MIN_PASSWORD_LENGTH = 8
 SESSION_TOKEN_BYTES = 32  # 32 bytes = 64 hex characters
 SESSION_EXPIRY_HOURS = 24  # Sessions expire after 24 hours of inactivity
 
+# bcrypt work factor. BCRYPT_ROUNDS can change it within
+# [MIN_BCRYPT_ROUNDS, MAX_BCRYPT_ROUNDS].
+DEFAULT_BCRYPT_ROUNDS = 12
+MIN_BCRYPT_ROUNDS = 10
+MAX_BCRYPT_ROUNDS = 31
+
 # Email regex pattern
 EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
 
 
+def get_bcrypt_rounds() -> int:
+    """Get the bcrypt work factor for new hashes.
+
+    Returns:
+        BCRYPT_ROUNDS from the environment if valid, else DEFAULT_BCRYPT_ROUNDS.
+        Values below MIN_BCRYPT_ROUNDS are raised to it with a warning.
+    """
+    try:
+        rounds = int(os.getenv("BCRYPT_ROUNDS", DEFAULT_BCRYPT_ROUNDS))
+    except ValueError:
+        return DEFAULT_BCRYPT_ROUNDS
+
+    if rounds < MIN_BCRYPT_ROUNDS:
+        logger.warning(f"BCRYPT_ROUNDS={rounds} is too weak; using {MIN_BCRYPT_ROUNDS}")
+        return MIN_BCRYPT_ROUNDS
+    return min(rounds, MAX_BCRYPT_ROUNDS)
+
+
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt.
 
@@ -31,7 +59,7 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string.
     """
-    salt = bcrypt.gensalt(rounds=12)
+    salt = bcrypt.gensalt(rounds=get_bcrypt_rounds())
     hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
     return hashed.decode("utf-8")
 
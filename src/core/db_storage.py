@@ -162,6 +162,22 @@ class DatabaseStorage:
 
             return cards
 
+    def has_cards(self) -> bool:
+        """Check whether the user has at least one card.
+
+        Cheaper than get_all_cards() when only existence matters: no
+        credits/benefits are loaded and the scan stops at the first row.
+
+        Returns:
+            True if any card exists for this user.
+        """
+        with get_cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM cards WHERE user_id = %s LIMIT 1",
+                (str(self.user_id),)
+            )
+            return cursor.fetchone() is not None
+
     def get_card(self, card_id: str) -> Card | None:
         """Get a single card by ID.
 
@@ -400,6 +416,26 @@ class DatabaseStorage:
             )
             return cursor.rowcount > 0
 
+    def delete_cards(self, card_ids: list[str]) -> int:
+        """Delete several cards by ID in a single statement.
+
+        Args:
+            card_ids: Card UUID strings.
+
+        Returns:
+            Number of cards deleted.
+        """
+        card_ids = [str(card_id) for card_id in card_ids]
+        if not card_ids:
+            return 0
+
+        with get_cursor() as cursor:
+            cursor.execute(
+                "DELETE FROM cards WHERE id = ANY(%s::uuid[]) AND user_id = %s",
+                (card_ids, str(self.user_id))
+            )
+            return cursor.rowcount
+
     # ==================== PREFERENCES ====================
 
     def get_preferences(self) -> UserPreferences:
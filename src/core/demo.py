@@ -8,6 +8,7 @@ from datetime import date, timedelta
 from typing import List
 
 from src.core.models import Card, Credit, SignupBonus, CreditUsage
+from src.core.periods import FREQUENCY_MULTIPLIERS
 
 
 def get_demo_cards() -> List[Card]:
@@ -226,14 +227,7 @@ def get_demo_summary() -> dict:
     total_credits_value = 0
     for card in cards:
         for credit in card.credits:
-            if credit.frequency == "monthly":
-                total_credits_value += credit.amount * 12
-            elif credit.frequency == "quarterly":
-                total_credits_value += credit.amount * 4
-            elif credit.frequency in ["semi-annual", "semi-annually"]:
-                total_credits_value += credit.amount * 2
-            else:
-                total_credits_value += credit.amount
+            total_credits_value += credit.amount * FREQUENCY_MULTIPLIERS.get(credit.frequency, 1)
 
     # Pending SUBs
     pending_subs = [c for c in cards if c.signup_bonus and not c.sub_achieved]
@@ -0,0 +1,132 @@
+"""On-disk cache for fetched pages and AI extraction results.
+
+Entries are JSON files named by the SHA-256 of their key, so a repeated
+fetch or extraction becomes a local file read instead of a Jina Reader
+request or an LLM call.
+
+The cache is opt-in: it is only used when CHURN_CACHE_DIR points at a
+directory, and CHURN_NO_CACHE=1 turns it off again. The app leaves it
+unset so live card offers are always fetched fresh.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Directory for cache entries (cache disabled when unset)
+CACHE_DIR_ENV = "CHURN_CACHE_DIR"
+# Set to a truthy value to bypass the cache
+NO_CACHE_ENV = "CHURN_NO_CACHE"
+
+
+def _cache_dir() -> Optional[Path]:
+    """Return the cache directory, or None when caching is disabled."""
+    if os.getenv(NO_CACHE_ENV, "").lower() in ("1", "true", "yes"):
+        return None
+    cache_dir = os.getenv(CACHE_DIR_ENV)
+    return Path(cache_dir) if cache_dir else None
+
+
+def is_cache_enabled() -> bool:
+    """Check whether the extraction cache is turned on."""
+    return _cache_dir() is not None
+
+
+def make_cache_key(*parts: str) -> str:
+    """Build a cache key from several string fields.
+
+    Each field is prefixed with its 8-byte length before hashing, so
+    ("ab", "c") and ("a", "bc") produce different keys.
+
+    Args:
+        parts: Fields identifying the cached value (URL, model, content...).
+
+    Returns:
+        Hex SHA-256 digest of the length-prefixed fields.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part.encode("utf-8")
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def get_cached(key: str) -> Optional[str]:
+    """Return the cached value for a key, or None on a miss.
+
+    Args:
+        key: Key from make_cache_key().
+
+    Returns:
+        The stored string, or None if missing, unreadable or disabled.
+    """
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return None
+
+    try:
+        with open(cache_dir / f"{key}.json", encoding="utf-8") as f:
+            return json.load(f)["value"]
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable cache entry {key}: {e}")
+        return None
+
+
+def set_cached(key: str, value: str) -> None:
+    """Store a value under a key (no-op when the cache is disabled).
+
+    The entry is written to a temporary file and renamed into place, so
+    readers never see a partial file. Write failures are logged, not raised.
+
+    Args:
+        key: Key from make_cache_key().
+        value: String to store (e.g. Markdown or a JSON document).
+    """
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return
+
+    tmp_path = None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Unique temp name, so concurrent writers of one key never share a file
+        with tempfile.NamedTemporaryFile(
+            "w", dir=cache_dir, suffix=".tmp", delete=False, encoding="utf-8"
+        ) as f:
+            tmp_path = f.name
+            json.dump({"value": value}, f)
+        os.replace(tmp_path, cache_dir / f"{key}.json")
+    except OSError as e:
+        logger.warning(f"Failed to write cache entry {key}: {e}")
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def evict(key: str) -> None:
+    """Remove a cache entry, e.g. one that no longer validates.
+
+    Args:
+        key: Key from make_cache_key().
+    """
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return
+
+    try:
+        (cache_dir / f"{key}.json").unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Failed to evict cache entry {key}: {e}")
@@ -4,12 +4,15 @@ Uses Jina Reader API (r.jina.ai) to fetch clean Markdown from any URL,
 including JavaScript-rendered pages. No browser installation required.
 """
 
+import atexit
 import re
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .exceptions import FetchError
+from .extraction_cache import make_cache_key, get_cached, set_cached
 
 # Jina Reader API endpoint - converts any URL to clean Markdown
 JINA_READER_PREFIX = "https://r.jina.ai/"
@@ -45,6 +48,23 @@ HEADERS = {
 DEFAULT_TIMEOUT = 60
 
 
+def _create_session() -> requests.Session:
+    """Create the pooled session shared by all Jina Reader requests.
+
+    Keeping connections alive means repeat fetches skip the TCP and TLS
+    handshake with r.jina.ai.
+    """
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20)
+    session.mount("https://", adapter)
+    return session
+
+
+_session = _create_session()
+atexit.register(_session.close)
+
+
 def fetch_card_page(url: str, timeout: int = DEFAULT_TIMEOUT) -> str:
     """Fetch and extract text content from a card terms URL.
 
@@ -80,8 +100,16 @@ def fetch_card_page(url: str, timeout: int = DEFAULT_TIMEOUT) -> str:
             f"Supported: {', '.join(ALLOWED_DOMAINS[:5])}..."
         )
 
+    # Reuse a previously fetched copy when the on-disk cache is enabled
+    cache_key = make_cache_key("fetch", url)
+    cached = get_cached(cache_key)
+    if cached is not None:
+        return cached
+
     # Use Jina Reader to fetch clean Markdown
-    return _fetch_with_jina(url, timeout)
+    content = _fetch_with_jina(url, timeout)
+    set_cached(cache_key, content)
+    return content
 
 
 def _fetch_with_jina(url: str, timeout: int) -> str:
@@ -103,7 +131,7 @@ def _fetch_with_jina(url: str, timeout: int) -> str:
     jina_url = f"{JINA_READER_PREFIX}{url}"
 
     try:
-        response = requests.get(jina_url, headers=HEADERS, timeout=timeout)
+        response = _session.get(jina_url, timeout=timeout)
         response.raise_for_status()
 
         content = response.text
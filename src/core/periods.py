@@ -9,6 +9,16 @@ from datetime import date
 from .models import CreditUsage
 
 
+# Number of times a credit resets per year, keyed by frequency.
+# Frequencies not listed here (e.g. "annual") count once per year.
+FREQUENCY_MULTIPLIERS = {
+    "monthly": 12,
+    "quarterly": 4,
+    "semi-annual": 2,
+    "semi-annually": 2,
+}
+
+
 def get_current_period(frequency: str, ref_date: date | None = None) -> str:
     """Get the current period identifier for a given frequency.
 
@@ -100,12 +110,33 @@ def is_credit_used_this_period(
         True if the credit was used this period, False otherwise
     """
     current_period = get_current_period(frequency, ref_date)
+    return is_credit_used_in_period(credit_name, current_period, credit_usage)
+
+
+def is_credit_used_in_period(
+    credit_name: str,
+    period: str,
+    credit_usage: dict[str, CreditUsage],
+) -> bool:
+    """Check if a credit was marked as used in an already-computed period.
+
+    Use this instead of is_credit_used_this_period when checking many
+    credits, so get_current_period runs once per frequency, not per credit.
+
+    Args:
+        credit_name: Name of the credit
+        period: Period identifier from get_current_period
+        credit_usage: Dictionary of credit usage data
+
+    Returns:
+        True if the credit was used in the given period, False otherwise
+    """
     usage = credit_usage.get(credit_name)
 
     if usage is None:
         return False
 
-    return usage.last_used_period == current_period
+    return usage.last_used_period == period
 
 
 def is_reminder_snoozed(
@@ -151,12 +182,34 @@ def get_unused_credits_count(
     Returns:
         Number of unused credits
     """
-    count = 0
+    return get_credits_stats(credits, credit_usage, ref_date, include_snoozed)[1]
+
+
+def get_credits_stats(
+    credits: list,
+    credit_usage: dict[str, CreditUsage],
+    ref_date: date | None = None,
+    include_snoozed: bool = False,
+) -> tuple[int, int]:
+    """Count total and unused credits in a single pass over the list.
+
+    Args:
+        credits: List of Credit objects
+        credit_usage: Dictionary of credit usage data
+        ref_date: Reference date (defaults to today)
+        include_snoozed: Whether to count snoozed credits as unused
+
+    Returns:
+        Tuple of (total credits, unused credits)
+    """
+    total = 0
+    unused = 0
     for credit in credits:
+        total += 1
         if not is_credit_used_this_period(credit.name, credit.frequency, credit_usage, ref_date):
             if include_snoozed or not is_reminder_snoozed(credit.name, credit_usage, ref_date):
-                count += 1
-    return count
+                unused += 1
+    return total, unused
 
 
 def mark_credit_used(
@@ -11,17 +11,21 @@ No brittle HTML parsing - just clean data in, structured data out.
 import json
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from uuid import UUID
 from typing import Optional
 
 from dotenv import load_dotenv
+from pydantic import ValidationError as PydanticValidationError
 
 from .models import CardData, SignupBonus, Credit
 from .exceptions import ExtractionError
 from .fetcher import fetch_card_page
+from .preprocessor import filter_markdown_sections
 from .enrichment import enrich_card_data, get_enrichment_summary
 from .ai_rate_limit import check_extraction_limit, record_extraction
+from .extraction_cache import make_cache_key, get_cached, set_cached, evict
 
 # Load environment variables
 load_dotenv(Path(__file__).parent.parent.parent / ".env")
@@ -93,7 +97,7 @@ def extract_from_url(url: str, timeout: int = 60, user_id: Optional[UUID] = None
 
     This is the main entry point for the extraction pipeline:
     1. Rate limit check (if user_id provided)
-    2. URL -> Jina Reader (fetches clean Markdown via fetcher module)
+    2. URL -> Jina Reader (fetches clean Markdown, trimmed to card-relevant sections)
     3. Markdown -> Claude (extracts structured data)
     4. CardData -> Auto-enrichment (adds missing credits from library)
     5. JSON -> CardData (validates and returns)
@@ -116,24 +120,34 @@ def extract_from_url(url: str, timeout: int = 60, user_id: Optional[UUID] = None
         if not can_extract:
             raise ExtractionError(message)
     
-    # Step 1: Fetch clean Markdown via Jina Reader (with domain validation)
-    markdown_content = fetch_card_page(url, timeout)
-
-    # Step 2: Extract structured data via AI (Gemini default, Claude fallback)
-    card_data, model_used, input_chars = _extract_with_ai(markdown_content)
-    
-    # Step 2.5: Record extraction with token estimates (if user_id provided)
-    if user_id:
-        # Estimate tokens: ~4 chars per token for English
-        est_input_tokens = input_chars // 4
-        est_output_tokens = 500  # Typical JSON response
-        record_extraction(
-            user_id,
-            input_tokens=est_input_tokens,
-            output_tokens=est_output_tokens,
-            model=model_used,
-            extraction_type="url"
-        )
+    # Step 1: Fetch clean Markdown via Jina Reader (with domain validation),
+    # keeping only the sections about fees, credits and bonuses
+    markdown_content = filter_markdown_sections(fetch_card_page(url, timeout))
+
+    # Step 2: Extract structured data via AI (Gemini default, Claude fallback),
+    # unless the on-disk cache already holds a result for this page and setup
+    cache_key = make_cache_key(
+        url, AI_PROVIDER, GEMINI_MODEL, CLAUDE_MODEL,
+        SYSTEM_PROMPT, EXTRACTION_PROMPT, markdown_content,
+    )
+    card_data = _get_cached_card_data(cache_key)
+
+    if card_data is None:
+        card_data, model_used, input_chars = _extract_with_ai(markdown_content)
+        set_cached(cache_key, card_data.model_dump_json())
+
+        # Step 2.5: Record extraction with token estimates (if user_id provided)
+        if user_id:
+            # Estimate tokens: ~4 chars per token for English
+            est_input_tokens = input_chars // 4
+            est_output_tokens = 500  # Typical JSON response
+            record_extraction(
+                user_id,
+                input_tokens=est_input_tokens,
+                output_tokens=est_output_tokens,
+                model=model_used,
+                extraction_type="url"
+            )
 
     # Step 3: Auto-enrich with library data (adds missing credits)
     enriched_data, match_result = enrich_card_data(card_data, min_confidence=0.7)
@@ -146,6 +160,90 @@ def extract_from_url(url: str, timeout: int = 60, user_id: Optional[UUID] = None
     return enriched_data
 
 
+def extract_from_urls(
+    urls: list[str],
+    timeout: int = 60,
+    max_workers: int = 4,
+    user_id: Optional[UUID] = None,
+) -> list[CardData]:
+    """Extract structured card data from several URLs concurrently.
+
+    Each URL goes through extract_from_url on a worker thread, so the
+    fetches and AI calls for different cards overlap instead of running
+    back to back. After the first failure no further extractions start;
+    ones already running finish and their results are discarded.
+
+    Args:
+        urls: URLs to extract card data from (must be from allowed domains).
+        timeout: HTTP request timeout in seconds, per URL.
+        max_workers: Maximum number of extractions in flight.
+        user_id: User UUID for rate limiting. The whole batch must fit in
+            the user's remaining extractions. If None, rate limiting is skipped.
+
+    Returns:
+        CardData for each URL, in the same order as urls.
+
+    Raises:
+        FetchError: If any URL fetch fails or its domain is not allowed
+            (the first failure is raised).
+        ExtractionError: If any AI extraction fails or rate limit exceeded.
+    """
+    if not urls:
+        return []
+
+    # Check the whole batch up front, before any worker starts
+    if user_id:
+        can_extract, remaining, message = check_extraction_limit(user_id)
+        if not can_extract:
+            raise ExtractionError(message)
+        if remaining < len(urls):
+            raise ExtractionError(
+                f"You have {remaining} AI extraction{'s' if remaining != 1 else ''} left today, "
+                f"but {len(urls)} cards were requested."
+            )
+
+    errors: list[Exception] = []
+
+    def extract(url: str) -> Optional[CardData]:
+        # Once a URL has failed, skip the ones not started yet so a failed
+        # batch doesn't keep calling the AI against the user's quota
+        if errors:
+            return None
+        try:
+            return extract_from_url(url, timeout, user_id)
+        except Exception as e:
+            errors.append(e)
+            return None
+
+    workers = min(max_workers, len(urls))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="extract") as executor:
+        results = list(executor.map(extract, urls))
+
+    if errors:
+        raise errors[0]
+    return results
+
+
+def _get_cached_card_data(cache_key: str) -> Optional[CardData]:
+    """Load a cached extraction result, evicting entries that no longer validate.
+
+    Args:
+        cache_key: Key built from the URL, model setup, prompts and page content.
+
+    Returns:
+        Cached CardData, or None on a miss (including a stale entry).
+    """
+    cached = get_cached(cache_key)
+    if cached is None:
+        return None
+
+    try:
+        return CardData.model_validate_json(cached)
+    except PydanticValidationError:
+        evict(cache_key)
+        return None
+
+
 def _extract_with_ai(content: str, max_content_chars: int = 15000) -> tuple:
     """Extract structured card data using the configured AI provider.
     
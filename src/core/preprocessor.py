@@ -42,6 +42,69 @@ PRIORITY_KEYWORDS = [
     "tsa precheck",
 ]
 
+# Markdown section headers (## and deeper) and the ones worth sending to the AI
+SECTION_HEADER_RE = re.compile(r"^(#{2,6}) +(.*)$", re.MULTILINE)
+# (whole words, so "Learn More" or "Feedback" don't match)
+RELEVANT_SECTION_RE = re.compile(
+    r"\b(?:credits?|benefits?|fees?|bonus(?:es)?|welcome|offers?|rewards?|perks?|earn(?:ing)?|points?)\b",
+    re.IGNORECASE,
+)
+# Terms the extraction cannot do without. If the page mentions one but the
+# filtered text does not, the filter dropped it and the full page is used.
+ESSENTIAL_TERM_RES = (
+    re.compile(r"\bannual\s+fees?\b", re.IGNORECASE),
+    re.compile(r"\b(?:bonus(?:es)?|welcome\s+offers?)\b", re.IGNORECASE),
+)
+
+
+def filter_markdown_sections(markdown: str, lead_chars: int = 500) -> str:
+    """Keep only the card-relevant sections of a Markdown page.
+
+    Splits on ## (and deeper) headers and keeps sections whose header
+    mentions fees, credits, bonuses and similar, along with their
+    subsections. The page title and the start of the intro are always
+    kept, since they usually name the card and issuer.
+
+    Args:
+        markdown: Markdown content from Jina Reader.
+        lead_chars: Characters of the text before the first section to keep.
+
+    Returns:
+        Filtered Markdown, or the input unchanged if it has no matching
+        sections or filtering would drop the annual fee or bonus text.
+    """
+    headers = list(SECTION_HEADER_RE.finditer(markdown))
+    if not headers:
+        return markdown
+
+    parts = []
+    lead = markdown[:headers[0].start()]
+    title = re.search(r"^# .*$", lead, re.MULTILINE)
+    if title and title.start() >= lead_chars:
+        parts.append(title.group(0))
+    parts.append(lead[:lead_chars].strip())
+
+    kept_any = False
+    keep_level = None  # Header level of the kept section we are inside
+    for i, header in enumerate(headers):
+        level = len(header.group(1))
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(markdown)
+
+        if keep_level is None or level <= keep_level:
+            keep_level = level if RELEVANT_SECTION_RE.search(header.group(2)) else None
+        if keep_level is not None:
+            parts.append(markdown[header.start():end].strip())
+            kept_any = True
+
+    if not kept_any:
+        return markdown
+
+    filtered = "\n\n".join(part for part in parts if part)
+    for term_re in ESSENTIAL_TERM_RES:
+        if term_re.search(markdown) and not term_re.search(filtered):
+            return markdown
+    return filtered
+
 
 def preprocess_text(text: str, max_chars: int = 8000) -> str:
     """Clean and filter text before sending to AI extraction.
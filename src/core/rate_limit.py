@@ -1,17 +1,37 @@
 """Rate limiting for authentication and user actions.
 
 Provides simple in-memory rate limiting to prevent abuse.
+
+Each store is an OrderedDict kept in last-update order, so records that
+have gone quiet are dropped from the front in O(1) per record instead of
+accumulating for the life of the process. Streamlit serves each session
+on its own thread, so every read-modify-write of a store holds _lock.
 """
 
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, Tuple
+from itertools import islice
+from typing import Optional, Tuple
+
+
+@dataclass(slots=True)
+class RateLimitRecord:
+    """Attempt counter for one rate-limited key."""
+
+    count: int = 0
+    locked_until: Optional[datetime] = None
+    window_start: datetime = field(default_factory=datetime.utcnow)
+    last_update: datetime = field(default_factory=datetime.utcnow)
 
 
-# Rate limit storage (in-memory, module-level)
-# Format: {key: {"count": int, "locked_until": datetime | None, "window_start": datetime}}
-_login_attempts: Dict[str, Dict] = {}
-_signup_attempts: Dict[str, Dict] = {}
-_feedback_attempts: Dict[str, Dict] = {}
+# Rate limit storage (in-memory, module-level, oldest update first)
+_login_attempts: "OrderedDict[str, RateLimitRecord]" = OrderedDict()
+_signup_attempts: "OrderedDict[str, RateLimitRecord]" = OrderedDict()
+_feedback_attempts: "OrderedDict[str, RateLimitRecord]" = OrderedDict()
+# Guards all three stores
+_lock = threading.Lock()
 
 # Configuration
 MAX_LOGIN_ATTEMPTS = 5
@@ -21,27 +41,88 @@ SIGNUP_WINDOW_HOURS = 1
 MAX_FEEDBACK_ATTEMPTS = 5
 FEEDBACK_WINDOW_HOURS = 1
 
+# How long a record is kept after its last update. A lockout is an
+# update, so locked records outlive their lockout.
+LOGIN_RECORD_TTL = timedelta(minutes=LOGIN_LOCKOUT_MINUTES)
+SIGNUP_RECORD_TTL = timedelta(hours=SIGNUP_WINDOW_HOURS)
+FEEDBACK_RECORD_TTL = timedelta(hours=FEEDBACK_WINDOW_HOURS)
+# Upper bound on records per store (oldest unlocked record dropped first)
+MAX_RECORDS_PER_STORE = 100_000
+
+
+def _evict_stale_records(storage: "OrderedDict[str, RateLimitRecord]", ttl: timedelta) -> None:
+    """Drop records not updated within ttl.
+    
+    Callers must hold _lock.
+    
+    Args:
+        storage: The storage dict to prune.
+        ttl: How long a record is kept after its last update.
+    """
+    cutoff = datetime.utcnow() - ttl
+    while storage and next(iter(storage.values())).last_update < cutoff:
+        storage.popitem(last=False)
+
 
-def _get_or_create_record(storage: Dict, key: str) -> Dict:
-    """Get or create a rate limit record.
+def _make_room(storage: "OrderedDict[str, RateLimitRecord]") -> None:
+    """Drop the least recently updated records so one more fits under the cap.
+    
+    Active lockouts are never dropped, so filling the store cannot be used
+    to clear one; the store only grows past the cap while every older
+    record is locked out. Callers must hold _lock.
+    
+    Args:
+        storage: The storage dict to trim.
+    """
+    excess = len(storage) - MAX_RECORDS_PER_STORE + 1
+    if excess <= 0:
+        return
+    now = datetime.utcnow()
+    unlocked = (
+        key for key, record in storage.items()
+        if record.locked_until is None or record.locked_until <= now
+    )
+    for key in list(islice(unlocked, excess)):
+        del storage[key]
+
+
+def _get_or_create_record(
+    storage: "OrderedDict[str, RateLimitRecord]", key: str, ttl: timedelta
+) -> RateLimitRecord:
+    """Get or create a rate limit record, pruning stale records first.
+    
+    Callers must hold _lock.
     
     Args:
         storage: The storage dict to use.
         key: The key to look up.
+        ttl: How long a record is kept after its last update.
         
     Returns:
         The rate limit record.
     """
-    if key not in storage:
-        storage[key] = {
-            "count": 0,
-            "locked_until": None,
-            "window_start": datetime.utcnow()
-        }
-    return storage[key]
+    _evict_stale_records(storage, ttl)
+    record = storage.get(key)
+    if record is None:
+        _make_room(storage)
+        record = storage[key] = RateLimitRecord()
+    return record
+
+
+def _touch_record(storage: "OrderedDict[str, RateLimitRecord]", key: str) -> None:
+    """Mark a record as just updated, moving it to the back of the store.
+    
+    Callers must hold _lock.
+    
+    Args:
+        storage: The storage dict holding the record.
+        key: The record's key.
+    """
+    storage[key].last_update = datetime.utcnow()
+    storage.move_to_end(key)
 
 
-def _reset_if_window_expired(record: Dict, window_hours: float) -> None:
+def _reset_if_window_expired(record: RateLimitRecord, window_hours: float) -> None:
     """Reset counter if the time window has expired.
     
     Args:
@@ -49,10 +130,10 @@ def _reset_if_window_expired(record: Dict, window_hours: float) -> None:
         window_hours: Size of the time window in hours.
     """
     window_duration = timedelta(hours=window_hours)
-    if datetime.utcnow() - record["window_start"] > window_duration:
-        record["count"] = 0
-        record["window_start"] = datetime.utcnow()
-        record["locked_until"] = None
+    if datetime.utcnow() - record.window_start > window_duration:
+        record.count = 0
+        record.window_start = datetime.utcnow()
+        record.locked_until = None
 
 
 def check_login_rate_limit(email: str) -> Tuple[bool, str]:
@@ -66,26 +147,28 @@ def check_login_rate_limit(email: str) -> Tuple[bool, str]:
         If not allowed, message contains user-friendly error.
     """
     email = email.lower().strip()
-    record = _get_or_create_record(_login_attempts, email)
+    with _lock:
+        record = _get_or_create_record(_login_attempts, email, LOGIN_RECORD_TTL)
     
-    # Check if currently locked out
-    if record["locked_until"]:
-        if datetime.utcnow() < record["locked_until"]:
-            remaining = record["locked_until"] - datetime.utcnow()
-            minutes = int(remaining.total_seconds() / 60) + 1
-            return False, f"Too many login attempts. Please try again in {minutes} minute{'s' if minutes != 1 else ''}."
-        else:
-            # Lockout expired, reset
-            record["count"] = 0
-            record["locked_until"] = None
+        # Check if currently locked out
+        if record.locked_until:
+            if datetime.utcnow() < record.locked_until:
+                remaining = record.locked_until - datetime.utcnow()
+                minutes = int(remaining.total_seconds() / 60) + 1
+                return False, f"Too many login attempts. Please try again in {minutes} minute{'s' if minutes != 1 else ''}."
+            else:
+                # Lockout expired, reset
+                record.count = 0
+                record.locked_until = None
     
-    # Check if limit reached
-    if record["count"] >= MAX_LOGIN_ATTEMPTS:
-        # Lock out
-        record["locked_until"] = datetime.utcnow() + timedelta(minutes=LOGIN_LOCKOUT_MINUTES)
-        return False, f"Too many login attempts. Please try again in {LOGIN_LOCKOUT_MINUTES} minutes."
+        # Check if limit reached
+        if record.count >= MAX_LOGIN_ATTEMPTS:
+            # Lock out
+            record.locked_until = datetime.utcnow() + timedelta(minutes=LOGIN_LOCKOUT_MINUTES)
+            _touch_record(_login_attempts, email)
+            return False, f"Too many login attempts. Please try again in {LOGIN_LOCKOUT_MINUTES} minutes."
     
-    return True, ""
+        return True, ""
 
 
 def record_login_failure(email: str) -> None:
@@ -95,8 +178,10 @@ def record_login_failure(email: str) -> None:
         email: Email address that failed to log in.
     """
     email = email.lower().strip()
-    record = _get_or_create_record(_login_attempts, email)
-    record["count"] += 1
+    with _lock:
+        record = _get_or_create_record(_login_attempts, email, LOGIN_RECORD_TTL)
+        record.count += 1
+        _touch_record(_login_attempts, email)
 
 
 def reset_login_attempts(email: str) -> None:
@@ -106,9 +191,11 @@ def reset_login_attempts(email: str) -> None:
         email: Email address that successfully logged in.
     """
     email = email.lower().strip()
-    if email in _login_attempts:
-        _login_attempts[email]["count"] = 0
-        _login_attempts[email]["locked_until"] = None
+    with _lock:
+        record = _login_attempts.get(email)
+        if record is not None:
+            record.count = 0
+            record.locked_until = None
 
 
 def check_signup_rate_limit(session_id: str) -> Tuple[bool, str]:
@@ -121,13 +208,14 @@ def check_signup_rate_limit(session_id: str) -> Tuple[bool, str]:
         Tuple of (allowed: bool, message: str).
         If not allowed, message contains user-friendly error.
     """
-    record = _get_or_create_record(_signup_attempts, session_id)
-    _reset_if_window_expired(record, SIGNUP_WINDOW_HOURS)
+    with _lock:
+        record = _get_or_create_record(_signup_attempts, session_id, SIGNUP_RECORD_TTL)
+        _reset_if_window_expired(record, SIGNUP_WINDOW_HOURS)
     
-    if record["count"] >= MAX_SIGNUP_ATTEMPTS:
-        return False, f"Too many signup attempts. Please try again in {SIGNUP_WINDOW_HOURS} hour{'s' if SIGNUP_WINDOW_HOURS != 1 else ''}."
+        if record.count >= MAX_SIGNUP_ATTEMPTS:
+            return False, f"Too many signup attempts. Please try again in {SIGNUP_WINDOW_HOURS} hour{'s' if SIGNUP_WINDOW_HOURS != 1 else ''}."
     
-    return True, ""
+        return True, ""
 
 
 def record_signup_attempt(session_id: str) -> None:
@@ -136,8 +224,10 @@ def record_signup_attempt(session_id: str) -> None:
     Args:
         session_id: Unique session identifier.
     """
-    record = _get_or_create_record(_signup_attempts, session_id)
-    record["count"] += 1
+    with _lock:
+        record = _get_or_create_record(_signup_attempts, session_id, SIGNUP_RECORD_TTL)
+        record.count += 1
+        _touch_record(_signup_attempts, session_id)
 
 
 def check_feedback_rate_limit(user_id: str) -> Tuple[bool, str]:
@@ -150,13 +240,14 @@ def check_feedback_rate_limit(user_id: str) -> Tuple[bool, str]:
         Tuple of (allowed: bool, message: str).
         If not allowed, message contains user-friendly error.
     """
-    record = _get_or_create_record(_feedback_attempts, user_id)
-    _reset_if_window_expired(record, FEEDBACK_WINDOW_HOURS)
+    with _lock:
+        record = _get_or_create_record(_feedback_attempts, user_id, FEEDBACK_RECORD_TTL)
+        _reset_if_window_expired(record, FEEDBACK_WINDOW_HOURS)
     
-    if record["count"] >= MAX_FEEDBACK_ATTEMPTS:
-        return False, "You've submitted several feedbacks recently. Please wait before submitting more."
+        if record.count >= MAX_FEEDBACK_ATTEMPTS:
+            return False, "You've submitted several feedbacks recently. Please wait before submitting more."
     
-    return True, ""
+        return True, ""
 
 
 def record_feedback_submission(user_id: str) -> None:
@@ -165,29 +256,7 @@ def record_feedback_submission(user_id: str) -> None:
     Args:
         user_id: User's UUID string.
     """
-    record = _get_or_create_record(_feedback_attempts, user_id)
-    record["count"] += 1
-
-
-def cleanup_old_records(max_age_hours: int = 24) -> None:
-    """Clean up old rate limit records to prevent memory bloat.
-    
-    Call this periodically (e.g., once per hour) to remove stale records.
-    
-    Args:
-        max_age_hours: Remove records older than this many hours.
-    """
-    cutoff = datetime.utcnow() - timedelta(hours=max_age_hours)
-    
-    for storage in [_login_attempts, _signup_attempts, _feedback_attempts]:
-        keys_to_delete = []
-        for key, record in storage.items():
-            # Delete if window_start is old and not currently locked
-            if record["window_start"] < cutoff and not record["locked_until"]:
-                keys_to_delete.append(key)
-            # Delete if lockout expired long ago
-            elif record["locked_until"] and record["locked_until"] < cutoff:
-                keys_to_delete.append(key)
-        
-        for key in keys_to_delete:
-            del storage[key]
+    with _lock:
+        record = _get_or_create_record(_feedback_attempts, user_id, FEEDBACK_RECORD_TTL)
+        record.count += 1
+        _touch_record(_feedback_attempts, user_id)
@@ -2,6 +2,8 @@
 
 import streamlit as st
 from datetime import date, datetime, timedelta
+from functools import lru_cache
+import json
 import sys
 import os
 from pathlib import Path
@@ -561,6 +563,30 @@ CUSTOM_CSS = """
         color: var(--cp-text-muted) !important;
     }
     
+    /* ===== SPACING ===== */
+    /* Margins on existing elements in place of empty spacer elements */
+    .st-key-login_form [data-testid="stFormSubmitButton"],
+    .st-key-register_form [data-testid="stCaptionContainer"] {
+        margin-top: 1rem;
+    }
+    .st-key-export_csv_btn {
+        margin-top: 1rem;
+    }
+    [class*="st-key-cp_card_"] {
+        margin-bottom: 1rem;
+    }
+    .st-key-secondary_metrics {
+        margin-top: 12px;
+    }
+    .cp-credit-reset {
+        color: var(--cp-text-muted);
+        font-size: 0.875rem;
+        margin-bottom: 8px;
+    }
+    .cp-issuer-group {
+        margin-top: 1rem;
+    }
+
     /* ===== COOKIE CONSENT BANNER ===== */
     .cookie-consent-banner {
         position: fixed;
@@ -633,11 +659,14 @@ from src.core import (
     SignupBonus,
     get_display_name,
     CreditUsage,
+    FREQUENCY_MULTIPLIERS,
     get_current_period,
     get_period_display_name,
     is_credit_used_this_period,
+    is_credit_used_in_period,
     is_reminder_snoozed,
     get_unused_credits_count,
+    get_credits_stats,
     mark_credit_used,
     mark_credit_unused,
     snooze_all_reminders,
@@ -724,12 +753,13 @@ from src.ui.components.progress import PROGRESS_CSS
 from src.ui.components.collapsible import COLLAPSIBLE_CSS
 from src.ui.components.hero import HERO_CSS
 from src.ui.components.celebration import CELEBRATION_CSS
-from src.ui.components.onboarding_wizard import WIZARD_CSS, render_onboarding_wizard, should_show_wizard, mark_wizard_completed
+from src.ui.components.onboarding_wizard import render_onboarding_wizard, should_show_wizard, mark_wizard_completed
 
 # Import demo data
 from src.core.demo import get_demo_cards, get_demo_summary
 
-# Combined component CSS for injection
+# Combined component CSS for injection. WIZARD_CSS is left out: only new
+# users ever see the wizard, and render_onboarding_wizard injects it itself.
 COMPONENT_CSS = f"""
 {EMPTY_STATE_CSS}
 {LOADING_CSS}
@@ -738,9 +768,17 @@ COMPONENT_CSS = f"""
 {COLLAPSIBLE_CSS}
 {HERO_CSS}
 {CELEBRATION_CSS}
-{WIZARD_CSS}
 """
 
+# App and component CSS joined once at import so each rerun emits a single
+# markdown element. It must still be emitted on every rerun: Streamlit drops
+# elements that a rerun does not re-render, which would unload the styles.
+APP_CSS = CUSTOM_CSS + COMPONENT_CSS
+
+# The card library is a static in-memory dict, so its size is fixed for the
+# life of the process
+TEMPLATE_COUNT = len(get_all_templates())
+
 # Input validation
 MAX_INPUT_CHARS = 50000  # Max characters for pasted text
 
@@ -926,7 +964,6 @@ def show_auth_page():
             with st.form("login_form"):
                 email = st.text_input("Email", key="login_email", placeholder="you@example.com", max_chars=254)
                 password = st.text_input("Password", type="password", key="login_password", placeholder="••••••••", max_chars=128)
-                st.write("")  # spacing
                 submitted = st.form_submit_button("Sign In", use_container_width=True, type="primary")
 
                 if submitted:
@@ -963,8 +1000,7 @@ def show_auth_page():
                 email = st.text_input("Email", key="register_email", placeholder="you@example.com", max_chars=254)
                 password = st.text_input("Password", type="password", key="register_password", placeholder="Min 8 characters", max_chars=128)
                 password_confirm = st.text_input("Confirm Password", type="password", key="register_password_confirm", placeholder="••••••••", max_chars=128)
-                st.write("")  # spacing
-                
+
                 # Consent notice
                 st.caption("By creating an account, you agree to our [Privacy Policy](?page=privacy) and [Terms of Service](?page=terms).")
                 
@@ -1224,8 +1260,12 @@ def submit_feedback(feedback_type: str, message: str, page: str = None, user_age
         return False
 
 
-def render_sidebar():
-    """Render the sidebar with app info and quick stats."""
+def render_sidebar(cards):
+    """Render the sidebar with app info and quick stats.
+
+    Args:
+        cards: Cards already loaded for this run (demo or user cards)
+    """
     with st.sidebar:
         st.markdown("""
         <div style="margin-bottom: 4px;">
@@ -1235,11 +1275,7 @@ def render_sidebar():
         """, unsafe_allow_html=True)
         st.caption("Credit Card Intelligence")
 
-        # Quick stats - use demo cards if in demo mode
-        if st.session_state.get("demo_mode"):
-            cards = get_demo_cards()
-        else:
-            cards = st.session_state.storage.get_all_cards()
+        # Quick stats
         if cards:
             st.divider()
             st.markdown("**Quick Stats**")
@@ -1263,14 +1299,7 @@ def render_sidebar():
             total_benefits_value = 0
             for card in cards:
                 for credit in card.credits:
-                    if credit.frequency == "monthly":
-                        total_benefits_value += credit.amount * 12
-                    elif credit.frequency == "quarterly":
-                        total_benefits_value += credit.amount * 4
-                    elif credit.frequency in ["semi-annual", "semi-annually"]:
-                        total_benefits_value += credit.amount * 2
-                    else:
-                        total_benefits_value += credit.amount
+                    total_benefits_value += credit.amount * FREQUENCY_MULTIPLIERS.get(credit.frequency, 1)
 
             # Net value
             net_value = total_benefits_value - total_fees
@@ -1331,14 +1360,15 @@ def render_sidebar():
                 st.caption("Business cards don't count (except Cap1, Discover, TD Bank).")
 
             # Upcoming deadlines
+            today = date.today()
             upcoming = []
             for card in cards:
                 if card.signup_bonus and card.signup_bonus.deadline:
-                    days_left = (card.signup_bonus.deadline - date.today()).days
+                    days_left = (card.signup_bonus.deadline - today).days
                     if 0 <= days_left <= 30:
                         upcoming.append((card, days_left, "SUB"))
                 if card.annual_fee_date:
-                    days_left = (card.annual_fee_date - date.today()).days
+                    days_left = (card.annual_fee_date - today).days
                     if 0 <= days_left <= 30:
                         upcoming.append((card, days_left, "AF"))
 
@@ -1361,13 +1391,14 @@ def render_sidebar():
         if cards:
             st.divider()
             st.markdown("**Data**")
-            # Generate JSON export
-            import json
-            cards_data = [card.model_dump(mode='json') for card in cards]
-            json_str = json.dumps(cards_data, indent=2, default=str)
+            # Generate JSON export lazily, only when the button is clicked
             st.download_button(
                 label="Export (JSON)",
-                data=json_str,
+                data=lambda: json.dumps(
+                    [card.model_dump(mode='json') for card in cards],
+                    indent=2,
+                    default=str,
+                ),
                 file_name="churnpilot_cards.json",
                 mime="application/json",
             )
@@ -1445,7 +1476,7 @@ def render_sidebar():
             st.markdown("[Report on GitHub →](https://github.com/hendrixAIDev/churn_copilot_hendrix/issues)")
 
         st.divider()
-        st.caption(f"Library: {len(get_all_templates())} templates")
+        st.caption(f"Library: {TEMPLATE_COUNT} templates")
         
         # Legal footer
         st.divider()
@@ -2659,6 +2690,27 @@ def get_issuer_color(issuer: str) -> str:
     return colors.get(issuer, "#6366f1")
 
 
+@lru_cache(maxsize=4096)
+def card_display_name(name: str, nickname: str | None, issuer: str) -> str:
+    """Get the label for a card, e.g. "Travel (Sapphire Preferred)".
+
+    Memoized on the card's name fields, so the regex-based name
+    simplification runs once per card rather than once per tab per rerun.
+
+    Args:
+        name: Full card name.
+        nickname: Optional user nickname.
+        issuer: Card issuer.
+
+    Returns:
+        Simplified card name, prefixed with the nickname if set.
+    """
+    display_name = get_display_name(name, issuer)
+    if nickname:
+        display_name = f"{nickname} ({display_name})"
+    return display_name
+
+
 def render_card_item(card, show_issuer_header: bool = True, selection_mode: bool = False):
     """Render a single card item with compact display.
 
@@ -2670,9 +2722,7 @@ def render_card_item(card, show_issuer_header: bool = True, selection_mode: bool
     issuer_color = get_issuer_color(card.issuer)
 
     # Simplified card name (without issuer since it's shown separately)
-    display_name = get_display_name(card.name, card.issuer)
-    if card.nickname:
-        display_name = f"{card.nickname} ({display_name})"
+    display_name = card_display_name(card.name, card.nickname, card.issuer)
 
     # Check if this card is being edited or expanded
     editing_key = f"editing_{card.id}"
@@ -2680,21 +2730,23 @@ def render_card_item(card, show_issuer_header: bool = True, selection_mode: bool
     is_editing = st.session_state.get(editing_key, False)
     is_expanded = st.session_state.get(expanded_key, False)
 
+    today = date.today()
+
     # Calculate unused benefits count (excluding snoozed)
     unused_benefits = 0
     is_all_snoozed = False
     if card.credits:
         # Check if all reminders are snoozed for this card
-        if card.benefits_reminder_snoozed_until and card.benefits_reminder_snoozed_until > date.today():
+        if card.benefits_reminder_snoozed_until and card.benefits_reminder_snoozed_until > today:
             is_all_snoozed = True
         else:
-            unused_benefits = get_unused_credits_count(card.credits, card.credit_usage)
+            unused_benefits = get_unused_credits_count(card.credits, card.credit_usage, today)
 
     # Create status badges
     status_badges = []
     if card.signup_bonus and not card.sub_achieved:
         if card.signup_bonus.deadline:
-            days_left = (card.signup_bonus.deadline - date.today()).days
+            days_left = (card.signup_bonus.deadline - today).days
             if days_left < 0:
                 status_badges.append(('<span class="badge badge-danger">SUB EXPIRED</span>', 0))
             elif days_left <= 14:
@@ -2715,7 +2767,7 @@ def render_card_item(card, show_issuer_header: bool = True, selection_mode: bool
     status_badges.sort(key=lambda x: x[1])
     badge_html = ' '.join([b[0] for b in status_badges[:3]])  # Limit to 3 badges
 
-    with st.container():
+    with st.container(key=f"cp_card_{card.id}"):
         # Main row: [checkbox] | issuer | name | badges | fee | actions
         if selection_mode:
             if show_issuer_header:
@@ -2861,7 +2913,7 @@ def render_card_item(card, show_issuer_header: bool = True, selection_mode: bool
 
                 # Show deadline info inline
                 if card.signup_bonus.deadline:
-                    days_left = (card.signup_bonus.deadline - date.today()).days
+                    days_left = (card.signup_bonus.deadline - today).days
                     if days_left < 0:
                         st.markdown('<span class="badge badge-danger">Deadline Passed</span>', unsafe_allow_html=True)
                     elif days_left <= 14:
@@ -2895,12 +2947,12 @@ def render_card_item(card, show_issuer_header: bool = True, selection_mode: bool
             snooze_col1, snooze_col2 = st.columns([6, 1])
             with snooze_col2:
                 if st.button("Dismiss", key=f"snooze_all_{card.id}", help="Snooze reminders for 30 days", use_container_width=True):
-                    snooze_until = date.today() + timedelta(days=30)
+                    snooze_until = today + timedelta(days=30)
                     st.session_state.storage.update_card(card.id, {"benefits_reminder_snoozed_until": snooze_until})
                     st.toast("Reminders snoozed for 30 days", icon="🔕")
         elif is_all_snoozed:
             # Show option to unsnooze
-            days_until_unsnooze = (card.benefits_reminder_snoozed_until - date.today()).days
+            days_until_unsnooze = (card.benefits_reminder_snoozed_until - today).days
             st.markdown(
                 f"<div style='background: var(--cp-surface-overlay); padding: 10px 14px; border-radius: 10px; margin: 8px 0; "
                 f"display: flex; justify-content: space-between; align-items: center;'>"
@@ -2921,11 +2973,11 @@ def render_card_item(card, show_issuer_header: bool = True, selection_mode: bool
 
             with detail_col1:
                 if card.opened_date:
-                    days_held = (date.today() - card.opened_date).days
+                    days_held = (today - card.opened_date).days
                     st.caption(f"Opened: {card.opened_date} ({days_held}d ago)")
 
                 if card.annual_fee_date:
-                    days_until_af = (card.annual_fee_date - date.today()).days
+                    days_until_af = (card.annual_fee_date - today).days
                     if days_until_af <= 30:
                         st.error(f"Annual Fee Due: {card.annual_fee_date} ({days_until_af}d)")
                     else:
@@ -2953,15 +3005,7 @@ def render_card_item(card, show_issuer_header: bool = True, selection_mode: bool
 
                     for credit in card.credits:
                         # Calculate annual value
-                        if credit.frequency == "monthly":
-                            annual = credit.amount * 12
-                        elif credit.frequency == "quarterly":
-                            annual = credit.amount * 4
-                        elif credit.frequency in ["semi-annual", "semi-annually"]:
-                            annual = credit.amount * 2
-                        else:
-                            annual = credit.amount
-                        total_value += annual
+                        total_value += credit.amount * FREQUENCY_MULTIPLIERS.get(credit.frequency, 1)
 
                         # Get current period for this credit
                         period_name = get_period_display_name(credit.frequency)
@@ -3007,8 +3051,7 @@ def render_card_item(card, show_issuer_header: bool = True, selection_mode: bool
                             # Save to storage
                             st.session_state.storage.update_card(card.id, {"credit_usage": new_usage})
                             
-                        st.caption(f"↻ Resets: {period_name}")
-                        st.markdown("<div style='margin-bottom: 8px;'></div>", unsafe_allow_html=True)
+                        st.markdown(f"<div class='cp-credit-reset'>↻ Resets: {period_name}</div>", unsafe_allow_html=True)
 
                     # Total value summary
                     st.markdown(
@@ -3018,8 +3061,6 @@ def render_card_item(card, show_issuer_header: bool = True, selection_mode: bool
                         unsafe_allow_html=True
                     )
 
-        st.write("")  # Spacing
-
 
 def go_to_add_card():
     """Navigate to the Add Card tab."""
@@ -3027,15 +3068,35 @@ def go_to_add_card():
     st.rerun()
 
 
+def advance_onboarding():
+    """Move the onboarding wizard to its next step (button callback)."""
+    st.session_state.wizard_step += 1
+
+
+def complete_onboarding():
+    """Finish the onboarding wizard (button callback).
+
+    Finishing from step 2 ("Add Card Now") also opens the Add Card section.
+    """
+    if st.session_state.wizard_step == 2:
+        st.session_state.navigate_to_add_card = True
+    mark_wizard_completed(st.session_state.get("user_id"))
+    st.session_state.wizard_step = 1
+
+
+def skip_onboarding():
+    """Skip the onboarding wizard and show the main app (button callback)."""
+    mark_wizard_completed(st.session_state.get("user_id"))
+    st.session_state.wizard_step = 1
+
+
 def render_empty_dashboard():
     """Render a welcoming empty state when no cards exist."""
-    templates = get_all_templates()
-
     # Use the new EmptyState component with callback to navigate to Add Card tab
     render_empty_state(
         illustration="cards",
         title="Welcome to ChurnPilot!",
-        description=f"Start tracking your credit cards to manage benefits and deadlines. Library includes {len(templates)} popular card templates ready to use.",
+        description=f"Start tracking your credit cards to manage benefits and deadlines. Library includes {TEMPLATE_COUNT} popular card templates ready to use.",
         action_label="➕ Add Your First Card",
         action_callback=go_to_add_card,
         key="empty_dashboard_add_card",
@@ -3158,8 +3219,12 @@ def export_cards_to_csv(cards):
     return output.getvalue()
 
 
-def render_dashboard():
-    """Render the card dashboard with filtering, sorting, and grouping."""
+def render_dashboard(cards):
+    """Render the card dashboard with filtering, sorting, and grouping.
+
+    Args:
+        cards: Cards already loaded for this run (demo or user cards)
+    """
     # Show success message if card was just added (persists across rerun)
     if st.session_state.get("card_just_added"):
         st.success(f"✓ Added: {st.session_state.card_just_added}")
@@ -3172,55 +3237,45 @@ def render_dashboard():
             <span style="font-size: 1.2rem;">📋</span> Your Cards
         </h2>
         """, unsafe_allow_html=True)
-    with col_export:
-        st.write("")  # Spacing
-
-    # Use demo cards if in demo mode
-    if st.session_state.get("demo_mode"):
-        cards = get_demo_cards()
-    else:
-        cards = st.session_state.storage.get_all_cards()
 
     if not cards:
         render_empty_dashboard()
         return
 
-    # Export button in the column
+    today = date.today()
+
+    # Export button in the column. The CSV is built only when the button is
+    # clicked rather than serialized on every rerun.
     with col_export:
-        csv_data = export_cards_to_csv(cards)
         st.download_button(
             label="Export to CSV",
-            data=csv_data,
-            file_name=f"churnpilot_cards_{date.today()}.csv",
+            data=lambda: export_cards_to_csv(cards),
+            file_name=f"churnpilot_cards_{today}.csv",
             mime="text/csv",
-            help="Download all cards as CSV spreadsheet"
+            help="Download all cards as CSV spreadsheet",
+            key="export_csv_btn",
         )
 
     # Calculate comprehensive metrics
     total_fees = sum(c.annual_fee for c in cards)
 
-    # Calculate total annual credits value
+    # Calculate total annual credits value and benefits usage stats in one
+    # pass over the cards
     total_credits_value = 0
+    total_benefits = 0
+    unused_benefits_total = 0
     for c in cards:
         for credit in c.credits:
-            if credit.frequency == "monthly":
-                total_credits_value += credit.amount * 12
-            elif credit.frequency == "quarterly":
-                total_credits_value += credit.amount * 4
-            elif credit.frequency in ["semi-annual", "semi-annually"]:
-                total_credits_value += credit.amount * 2
-            else:
-                total_credits_value += credit.amount
-
-    # Calculate benefits usage stats
-    total_benefits = sum(len(c.credits) for c in cards)
-    unused_benefits_total = sum(get_unused_credits_count(c.credits, c.credit_usage) for c in cards)
+            total_credits_value += credit.amount * FREQUENCY_MULTIPLIERS.get(credit.frequency, 1)
+        card_total, card_unused = get_credits_stats(c.credits, c.credit_usage, today)
+        total_benefits += card_total
+        unused_benefits_total += card_unused
 
     # SUB tracking
     cards_with_sub = [c for c in cards if c.signup_bonus and not c.sub_achieved]
     urgent_subs = [
         c for c in cards_with_sub
-        if c.signup_bonus.deadline and (c.signup_bonus.deadline - date.today()).days <= 30
+        if c.signup_bonus.deadline and (c.signup_bonus.deadline - today).days <= 30
     ]
 
     # Net value calculation (credits - fees)
@@ -3248,8 +3303,7 @@ def render_dashboard():
 
     # Secondary metrics row
     if total_benefits > 0:
-        st.markdown("<div style='margin-top: 12px;'></div>", unsafe_allow_html=True)
-        metric_col1, metric_col2, metric_col3 = st.columns(3)
+        metric_col1, metric_col2, metric_col3 = st.container(key="secondary_metrics").columns(3)
 
         with metric_col1:
             if net_value > 0:
@@ -3289,11 +3343,16 @@ def render_dashboard():
     # Filter, sort, group controls
     filter_col, sort_col, group_col, search_col = st.columns([2, 2, 1, 3])
 
+    # Bucket cards by issuer once; the dropdown options come from the bucket
+    # keys and an issuer filter becomes a dict lookup instead of a scan
+    cards_by_issuer = {}
+    for c in cards:
+        cards_by_issuer.setdefault(c.issuer, []).append(c)
+
     with filter_col:
-        issuers = sorted(set(c.issuer for c in cards))
         issuer_filter = st.selectbox(
             "Filter",
-            options=["All Issuers"] + issuers,
+            options=["All Issuers"] + sorted(cards_by_issuer),
             key="issuer_filter",
         )
 
@@ -3345,26 +3404,25 @@ def render_dashboard():
             max_chars=200
         )
 
-    # Apply filters
-    filtered_cards = cards
-
+    # Apply issuer filter via the bucket, then search what's left
     if issuer_filter != "All Issuers":
-        filtered_cards = [c for c in filtered_cards if c.issuer == issuer_filter]
-
+        filtered_cards = cards_by_issuer.get(issuer_filter, [])
+    else:
+        filtered_cards = cards
     if search_query:
         query_lower = search_query.lower()
         filtered_cards = [
             c for c in filtered_cards
-            if query_lower in c.name.lower() or (c.nickname and query_lower in c.nickname.lower())
+            if query_lower in c.name.lower()
+            or (c.nickname and query_lower in c.nickname.lower())
         ]
 
     # Apply sorting
-    from datetime import datetime as dt
     if sort_option == "Date Added":
         # Sort by created_at, newest first (cards without created_at go last)
         filtered_cards = sorted(
             filtered_cards,
-            key=lambda c: c.created_at if c.created_at else dt.min,
+            key=lambda c: c.created_at if c.created_at else datetime.min,
             reverse=True
         )
     elif sort_option == "Date Opened":
@@ -3415,9 +3473,8 @@ def render_dashboard():
                 st.rerun()  # OK to rerun - no data to save
         with confirm_col2:
             if st.button("Delete All", key="confirm_bulk_delete_btn", type="primary"):
-                # Delete all selected cards
-                for card_id in st.session_state.selected_cards:
-                    st.session_state.storage.delete_card(card_id)
+                # Delete all selected cards in one round-trip
+                st.session_state.storage.delete_cards(list(st.session_state.selected_cards))
                 st.session_state.selected_cards = set()
                 st.session_state.confirm_bulk_delete = False
                 st.success("✓ Cards deleted!")
@@ -3431,24 +3488,100 @@ def render_dashboard():
 
     # Render cards (grouped or flat)
     if group_by_issuer and issuer_filter == "All Issuers":
-        # Group by issuer
-        issuers_in_list = sorted(set(c.issuer for c in filtered_cards))
-        for issuer in issuers_in_list:
+        # Group by issuer in one pass; filtered_cards is already sorted, so
+        # appending keeps the chosen sort order within each group
+        groups = {}
+        for card in filtered_cards:
+            groups.setdefault(card.issuer, []).append(card)
+
+        for issuer in sorted(groups):
             issuer_color = get_issuer_color(issuer)
             st.markdown(
-                f"<h4 style='color: {issuer_color}; margin-bottom: 0;'>{issuer}</h4>",
+                f"<h4 class='cp-issuer-group' style='color: {issuer_color}; margin-bottom: 0;'>{issuer}</h4>",
                 unsafe_allow_html=True
             )
-            issuer_cards = [c for c in filtered_cards if c.issuer == issuer]
-            for card in issuer_cards:
+            for card in groups[issuer]:
                 render_card_item(card, show_issuer_header=False, selection_mode=selection_mode)
-            st.write("")  # Space between groups
     else:
         # Flat list
         for card in filtered_cards:
             render_card_item(card, show_issuer_header=True, selection_mode=selection_mode)
 
 
+# Per-item HTML templates for the Action Required and 5/24 tabs. Each section
+# joins its items into one HTML string and renders it with a single
+# st.markdown call instead of one element per item.
+URGENT_SUB_ITEM_HTML = (
+    "<div style='padding: 14px 16px; margin: 8px 0; border-left: 4px solid {color}; background: {bg}; border-radius: 10px; color: var(--cp-text-on-surface);'>"
+    "<div style='display: flex; align-items: center; gap: 8px; margin-bottom: 4px;'>"
+    "<span style='font-size: 0.7rem; font-weight: 700; background: {color}; color: white; padding: 2px 8px; border-radius: 4px; letter-spacing: 0.05em;'>{urgency}</span>"
+    "<span style='font-weight: 600;'>{display_name}</span>"
+    "</div>"
+    "<span style='color: var(--cp-text-secondary); font-size: 0.85rem;'>"
+    "Deadline: {deadline} ({days}d) · "
+    "Spend: ${requirement:,.0f} · "
+    "Reward: {reward}"
+    "</span>"
+    "</div>"
+)
+UPCOMING_FEE_ITEM_HTML = (
+    "<div style='padding: 14px 16px; margin: 8px 0; border-left: 4px solid {color}; background: {bg}; border-radius: 10px; color: var(--cp-text-on-surface);'>"
+    "<span style='font-weight: 600;'>{display_name}</span><br>"
+    "<span style='color: var(--cp-text-secondary); font-size: 0.85rem;'>"
+    "Fee: ${amount:.0f} · Due: {fee_date} ({days}d)"
+    "</span>"
+    "</div>"
+)
+MISSING_DATA_ITEM_HTML = (
+    "<div style='padding: 10px 14px; margin: 4px 0; border-left: 3px solid var(--cp-text-muted); background: var(--cp-surface-raised); border-radius: 10px; color: var(--cp-text-on-surface);'>"
+    "<span style='font-weight: 600;'>{display_name}</span>"
+    "<span style='color: var(--cp-text-secondary); font-size: 0.85rem;'> — Missing opened date</span>"
+    "</div>"
+)
+TIMELINE_ITEM_HTML = (
+    "<div style='padding: 14px 16px; margin: 8px 0; border-left: 4px solid {color}; background: {bg}; border-radius: 10px; color: var(--cp-text-on-surface);'>"
+    "<span style='font-weight: 600;'>{display_name}</span><br>"
+    "<span style='color: var(--cp-text-secondary); font-size: 0.85rem;'>Opened: {opened_date} · Drops off: {drop_off} ({days}d)</span>"
+    "</div>"
+)
+
+
+# Urgency tiers as (max_days, ...styles), checked in order. The first tier
+# whose max_days is >= the item's day count wins; the last tier catches all.
+URGENT_SUB_TIERS = (
+    (-1, "EXPIRED", "#ef4444", "var(--cp-danger-bg)"),
+    (7, "URGENT", "#ef4444", "var(--cp-danger-bg)"),
+    (14, "SOON", "#f59e0b", "var(--cp-warning-bg)"),
+    (float("inf"), "ATTENTION", "#f59e0b", "var(--cp-warning-bg)"),
+)
+UPCOMING_FEE_TIERS = (
+    (14, "#ef4444", "var(--cp-danger-bg)"),
+    (30, "#f59e0b", "var(--cp-warning-bg)"),
+    (float("inf"), "#6366f1", "var(--cp-primary-bg)"),
+)
+TIMELINE_TIERS = (
+    (30, "#10b981", "var(--cp-success-bg)"),  # Green - drops soon
+    (180, "#f59e0b", "var(--cp-warning-bg)"),  # Yellow
+    (float("inf"), "#94a3b8", "var(--cp-surface-raised)"),  # Gray
+)
+
+
+def pick_urgency_tier(days: int, tiers: tuple) -> tuple:
+    """Return the styles of the first tier whose threshold covers days.
+
+    Args:
+        days: Days until (or since, if negative) the deadline
+        tiers: Tier table such as URGENT_SUB_TIERS
+
+    Returns:
+        The tier entry without its threshold, e.g. (urgency, color, bg)
+    """
+    for max_days, *styles in tiers:
+        if days <= max_days:
+            return tuple(styles)
+    return tuple(tiers[-1][1:])
+
+
 def render_action_required_tab():
     """Render the Action Required tab showing urgent items."""
     st.markdown("""
@@ -3473,13 +3606,13 @@ def render_action_required_tab():
     # Collect urgent items
     urgent_subs = []
     upcoming_fees = []
-    unused_credits = []
+    unused_credits_by_card = {}  # display_name -> unused credit items
+    unused_credit_count = 0
+    current_periods = {}  # frequency -> current period, computed once each
     missing_data = []
 
     for card in cards:
-        display_name = get_display_name(card.name, card.issuer)
-        if card.nickname:
-            display_name = f"{card.nickname} ({display_name})"
+        display_name = card_display_name(card.name, card.nickname, card.issuer)
 
         # Check SUB deadlines
         if card.signup_bonus and card.signup_bonus.deadline and not card.sub_achieved:
@@ -3510,15 +3643,18 @@ def render_action_required_tab():
         # Check unused credits
         for credit in card.credits:
             if credit.amount > 0:
-                is_used = is_credit_used_this_period(credit.name, credit.frequency, card.credit_usage)
-                if not is_used:
-                    unused_credits.append({
+                period = current_periods.get(credit.frequency)
+                if period is None:
+                    period = current_periods[credit.frequency] = get_current_period(credit.frequency, today)
+                if not is_credit_used_in_period(credit.name, period, card.credit_usage):
+                    unused_credits_by_card.setdefault(display_name, []).append({
                         "card": card,
-                        "display_name": display_name,
                         "credit_name": credit.name,
                         "amount": credit.amount,
-                        "frequency": credit.frequency
+                        "frequency": credit.frequency,
+                        "period": period,
                     })
+                    unused_credit_count += 1
 
         # Check missing opened_date (blocks 5/24 tracking)
         if not card.opened_date and not card.closed_date:
@@ -3528,7 +3664,7 @@ def render_action_required_tab():
             })
 
     # Display urgent items
-    total_items = len(urgent_subs) + len(upcoming_fees) + len(unused_credits) + len(missing_data)
+    total_items = len(urgent_subs) + len(upcoming_fees) + unused_credit_count + len(missing_data)
 
     if total_items == 0:
         st.success("All clear! No urgent action items.")
@@ -3543,39 +3679,23 @@ def render_action_required_tab():
 
         urgent_subs.sort(key=lambda x: x["days_left"])
 
+        items_html = []
         for item in urgent_subs:
             days = item["days_left"]
-            if days < 0:
-                urgency = "EXPIRED"
-                color = "#ef4444"
-                bg = "var(--cp-danger-bg)"
-            elif days <= 7:
-                urgency = "URGENT"
-                color = "#ef4444"
-                bg = "var(--cp-danger-bg)"
-            elif days <= 14:
-                urgency = "SOON"
-                color = "#f59e0b"
-                bg = "var(--cp-warning-bg)"
-            else:
-                urgency = "ATTENTION"
-                color = "#f59e0b"
-                bg = "var(--cp-warning-bg)"
+            urgency, color, bg = pick_urgency_tier(days, URGENT_SUB_TIERS)
 
-            st.markdown(
-                f"<div style='padding: 14px 16px; margin: 8px 0; border-left: 4px solid {color}; background: {bg}; border-radius: 10px; color: var(--cp-text-on-surface);'>"
-                f"<div style='display: flex; align-items: center; gap: 8px; margin-bottom: 4px;'>"
-                f"<span style='font-size: 0.7rem; font-weight: 700; background: {color}; color: white; padding: 2px 8px; border-radius: 4px; letter-spacing: 0.05em;'>{urgency}</span>"
-                f"<span style='font-weight: 600;'>{item['display_name']}</span>"
-                f"</div>"
-                f"<span style='color: var(--cp-text-secondary); font-size: 0.85rem;'>"
-                f"Deadline: {item['deadline']} ({days}d) · "
-                f"Spend: ${item['requirement']:,.0f} · "
-                f"Reward: {item['reward']}"
-                f"</span>"
-                f"</div>",
-                unsafe_allow_html=True
-            )
+            items_html.append(URGENT_SUB_ITEM_HTML.format(
+                color=color,
+                bg=bg,
+                urgency=urgency,
+                display_name=item["display_name"],
+                deadline=item["deadline"],
+                days=days,
+                requirement=item["requirement"],
+                reward=item["reward"],
+            ))
+
+        st.markdown("".join(items_html), unsafe_allow_html=True)
 
     # Section 2: Upcoming annual fees
     if upcoming_fees:
@@ -3584,59 +3704,46 @@ def render_action_required_tab():
 
         upcoming_fees.sort(key=lambda x: x["days_until"])
 
+        items_html = []
         for item in upcoming_fees:
             days = item["days_until"]
-            if days <= 14:
-                color = "#ef4444"
-                bg = "var(--cp-danger-bg)"
-            elif days <= 30:
-                color = "#f59e0b"
-                bg = "var(--cp-warning-bg)"
-            else:
-                color = "#6366f1"
-                bg = "var(--cp-primary-bg)"
+            color, bg = pick_urgency_tier(days, UPCOMING_FEE_TIERS)
 
-            st.markdown(
-                f"<div style='padding: 14px 16px; margin: 8px 0; border-left: 4px solid {color}; background: {bg}; border-radius: 10px; color: var(--cp-text-on-surface);'>"
-                f"<span style='font-weight: 600;'>{item['display_name']}</span><br>"
-                f"<span style='color: var(--cp-text-secondary); font-size: 0.85rem;'>"
-                f"Fee: ${item['amount']:.0f} · Due: {item['fee_date']} ({days}d)"
-                f"</span>"
-                f"</div>",
-                unsafe_allow_html=True
-            )
+            items_html.append(UPCOMING_FEE_ITEM_HTML.format(
+                color=color,
+                bg=bg,
+                display_name=item["display_name"],
+                amount=item["amount"],
+                fee_date=item["fee_date"],
+                days=days,
+            ))
+
+        st.markdown("".join(items_html), unsafe_allow_html=True)
 
     # Section 3: Unused credits
-    if unused_credits:
-        st.subheader(f"Unused Credits ({len(unused_credits)})")
+    if unused_credits_by_card:
+        st.subheader(f"Unused Credits ({unused_credit_count})")
         st.caption("Check off benefits as you use them - changes sync to Dashboard")
 
-        # Group by card
-        credits_by_card = {}
-        for item in unused_credits:
-            card_name = item["display_name"]
-            if card_name not in credits_by_card:
-                credits_by_card[card_name] = []
-            credits_by_card[card_name].append(item)
-
-        for card_name, credits in credits_by_card.items():
+        period_labels = {}  # frequency -> formatted current period
+        for card_name, credits in unused_credits_by_card.items():
             total_value = sum(c["amount"] for c in credits)
             with st.expander(f"{card_name} - ${total_value:.0f} available", expanded=True):
                 for credit in credits:
-                    # Get current period for display
-                    from src.core import get_current_period
-                    period = get_current_period(credit['frequency'])
-
-                    # Format period nicely for display
-                    if credit['frequency'].lower() == 'monthly':
-                        # "2026-01" -> "2026 Jan"
-                        year, month_num = period.split('-')
-                        month_names = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
-                                       "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
-                        period_display = f"{year} {month_names[int(month_num) - 1]}"
-                    else:
-                        # "2024-Q1" -> "2024 Q1", "2024-H1" -> "2024 H1", "2024" -> "2024"
-                        period_display = period.replace('-', ' ')
+                    # Format the current period nicely for display (once per frequency)
+                    period_display = period_labels.get(credit['frequency'])
+                    if period_display is None:
+                        period = credit['period']
+                        if credit['frequency'].lower() == 'monthly':
+                            # "2026-01" -> "2026 Jan"
+                            year, month_num = period.split('-')
+                            month_names = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                                           "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+                            period_display = f"{year} {month_names[int(month_num) - 1]}"
+                        else:
+                            # "2024-Q1" -> "2024 Q1", "2024-H1" -> "2024 H1", "2024" -> "2024"
+                            period_display = period.replace('-', ' ')
+                        period_labels[credit['frequency']] = period_display
 
                     # Build display label with period
                     benefit_label = f"{credit['credit_name']}: ${credit['amount']:.0f} ({credit['frequency']}) {period_display}"
@@ -3651,12 +3758,11 @@ def render_action_required_tab():
 
                     # If checkbox state changed to checked, mark credit as used
                     if is_checked:
-                        from src.core import mark_credit_used
                         new_usage = mark_credit_used(
                             credit['credit_name'],
                             credit['frequency'],
                             credit['card'].credit_usage,
-                            date.today()
+                            today
                         )
                         storage.update_card(credit['card'].id, {"credit_usage": new_usage})
                         st.toast("✓ Credit marked as used!", icon="✅")
@@ -3666,14 +3772,13 @@ def render_action_required_tab():
         st.subheader(f"Missing Data ({len(missing_data)})")
         st.caption("Add opened dates to enable 5/24 tracking and deadline calculations")
 
-        for item in missing_data:
-            st.markdown(
-                f"<div style='padding: 10px 14px; margin: 4px 0; border-left: 3px solid var(--cp-text-muted); background: var(--cp-surface-raised); border-radius: 10px; color: var(--cp-text-on-surface);'>"
-                f"<span style='font-weight: 600;'>{item['display_name']}</span>"
-                f"<span style='color: var(--cp-text-secondary); font-size: 0.85rem;'> — Missing opened date</span>"
-                f"</div>",
-                unsafe_allow_html=True
-            )
+        st.markdown(
+            "".join(
+                MISSING_DATA_ITEM_HTML.format(display_name=item["display_name"])
+                for item in missing_data
+            ),
+            unsafe_allow_html=True
+        )
 
 def render_five_twenty_four_tab():
     """Render the 5/24 tracking tab."""
@@ -3759,33 +3864,47 @@ def render_five_twenty_four_tab():
         return
 
     # Display timeline
+    items_html = []
     for item in timeline:
         card = item["card"]
         drop_off = item["drop_off_date"]
         days = item["days_until"]
 
-        display_name = get_display_name(card.name, card.issuer)
-        if card.nickname:
-            display_name = f"{card.nickname} ({display_name})"
+        display_name = card_display_name(card.name, card.nickname, card.issuer)
 
         # Color code by urgency
-        if days <= 30:
-            color = "#10b981"  # Green - drops soon
-            bg = "var(--cp-success-bg)"
-        elif days <= 180:
-            color = "#f59e0b"  # Yellow
-            bg = "var(--cp-warning-bg)"
-        else:
-            color = "#94a3b8"  # Gray
-            bg = "var(--cp-surface-raised)"
+        color, bg = pick_urgency_tier(days, TIMELINE_TIERS)
 
-        st.markdown(
-            f"<div style='padding: 14px 16px; margin: 8px 0; border-left: 4px solid {color}; background: {bg}; border-radius: 10px; color: var(--cp-text-on-surface);'>"
-            f"<span style='font-weight: 600;'>{display_name}</span><br>"
-            f"<span style='color: var(--cp-text-secondary); font-size: 0.85rem;'>Opened: {card.opened_date} · Drops off: {drop_off} ({days}d)</span>"
-            f"</div>",
-            unsafe_allow_html=True
-        )
+        items_html.append(TIMELINE_ITEM_HTML.format(
+            color=color,
+            bg=bg,
+            display_name=display_name,
+            opened_date=card.opened_date,
+            drop_off=drop_off,
+            days=days,
+        ))
+
+    st.markdown("".join(items_html), unsafe_allow_html=True)
+
+
+LEGAL_PAGES_DIR = Path(__file__).parent.parent.parent / "pages"
+
+
+@st.cache_data(show_spinner=False)
+def load_legal_page(file_name: str) -> str:
+    """Read a legal markdown page from disk, cached across reruns.
+
+    Args:
+        file_name: File name inside the pages directory
+
+    Returns:
+        Markdown content of the page
+
+    Raises:
+        FileNotFoundError: If the page does not exist
+    """
+    with open(LEGAL_PAGES_DIR / file_name, 'r') as f:
+        return f.read()
 
 
 def show_legal_page(page_type):
@@ -3795,17 +3914,16 @@ def show_legal_page(page_type):
         page_type: "privacy" or "terms"
     """
     # Read the markdown file
-    pages_dir = Path(__file__).parent.parent.parent / "pages"
     if page_type == "privacy":
-        file_path = pages_dir / "privacy_policy.md"
+        file_name = "privacy_policy.md"
         title = "Privacy Policy"
     else:  # terms
-        file_path = pages_dir / "terms_of_service.md"
+        file_name = "terms_of_service.md"
         title = "Terms of Service"
+    file_path = LEGAL_PAGES_DIR / file_name
     
     try:
-        with open(file_path, 'r') as f:
-            content = f.read()
+        content = load_legal_page(file_name)
         
         # Display with ChurnPilot branding
         st.markdown("""
@@ -3849,7 +3967,6 @@ def main():
     # Access via: ?health=capabilities
     if st.query_params.get("health") == "capabilities":
         from src.core.health import get_capability_status
-        import json
         st.set_page_config(page_title="Health Check", layout="centered")
         st.markdown("""
         <style>
@@ -3870,8 +3987,7 @@ def main():
     )
 
     # Inject custom CSS (both app-specific and component CSS)
-    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
-    st.markdown(COMPONENT_CSS, unsafe_allow_html=True)
+    st.markdown(APP_CSS, unsafe_allow_html=True)
 
     # Check for legal page requests (public, no auth required)
     legal_page = st.query_params.get("page")
@@ -3905,8 +4021,7 @@ def main():
         is_new_user = False  # Demo user sees cards
     else:
         try:
-            storage = DatabaseStorage(UUID(st.session_state.user_id))
-            st.session_state.storage = storage
+            st.session_state.storage = DatabaseStorage(UUID(st.session_state.user_id))
         except Exception as e:
             st.error("Unable to load your data. Please check your connection and refresh the page.")
             import logging
@@ -3919,11 +4034,11 @@ def main():
 
     # Show demo mode banner if active
     if st.session_state.demo_mode:
-        if render_demo_banner(
+        # The exit callback runs before the click's rerun, so that rerun
+        # already renders without demo mode
+        render_demo_banner(
             exit_callback=lambda: setattr(st.session_state, 'demo_mode', False)
-        ):
-            st.session_state.demo_mode = False
-            st.rerun()
+        )
 
     # Check for SUB completion celebration
     if st.session_state.get("celebrate_sub"):
@@ -3936,41 +4051,24 @@ def main():
         # Clear the flag
         st.session_state.celebrate_sub = None
 
-    render_sidebar()
+    # Reuse the cards loaded above - the sidebar and dashboard render before
+    # any writes in this run, so a second fetch would return the same rows
+    render_sidebar(cards)
 
     # Show onboarding wizard for new users (only when not in demo mode and no cards)
     user_id = st.session_state.get("user_id")
     if is_new_user and not st.session_state.demo_mode and should_show_wizard(user_id):
-        # Get template count for stats
-        template_count = len(get_all_templates())
-
-        wizard_action = render_onboarding_wizard(
+        # Step changes happen in the button callbacks, before the rerun the
+        # click triggers, so that rerun already shows the result
+        render_onboarding_wizard(
             current_step=st.session_state.wizard_step,
-            template_count=template_count,
-            on_complete=None,  # We'll handle completion in action handler
-            on_skip=None,      # We'll handle skip in action handler
+            template_count=TEMPLATE_COUNT,
+            on_complete=complete_onboarding,
+            on_skip=skip_onboarding,
             key_prefix="onboarding",
+            on_next=advance_onboarding,
         )
 
-        if wizard_action == "next":
-            st.session_state.wizard_step += 1
-            st.rerun()
-        elif wizard_action == "add_card":
-            # Complete wizard and navigate to add card
-            mark_wizard_completed(user_id)
-            st.session_state.navigate_to_add_card = True
-            st.rerun()
-        elif wizard_action == "complete":
-            # Wizard finished - reset step and mark completed
-            mark_wizard_completed(user_id)
-            st.session_state.wizard_step = 1
-            st.rerun()
-        elif wizard_action == "skip":
-            # User skipped - mark completed and show main app
-            mark_wizard_completed(user_id)
-            st.session_state.wizard_step = 1
-            st.rerun()
-
         # Don't show tabs yet while wizard is active
         return
 
@@ -3985,23 +4083,22 @@ def main():
         return
 
     # Four main tabs (reordered: Dashboard -> Action Required -> Add Card -> 5/24 Tracker)
-    tab1, tab2, tab3, tab4 = st.tabs(["Dashboard", "Action Required", "Add Card", "5/24 Tracker"])
-
-    with tab1:
-        st.session_state.current_tab = "Dashboard"
-        render_dashboard()
-
-    with tab2:
-        st.session_state.current_tab = "Action Required"
-        render_action_required_tab()
+    tab_renderers = {
+        "Dashboard": lambda: render_dashboard(cards),
+        "Action Required": render_action_required_tab,
+        "Add Card": render_add_card_section,
+        "5/24 Tracker": render_five_twenty_four_tab,
+    }
 
-    with tab3:
-        st.session_state.current_tab = "Add Card"
-        render_add_card_section()
+    # on_change="rerun" makes the tabs stateful, so only the selected tab's
+    # body runs on each rerun instead of all four
+    tabs = st.tabs(list(tab_renderers), key="active_tab", on_change="rerun")
+    st.session_state.current_tab = st.session_state.get("active_tab", "Dashboard")
 
-    with tab4:
-        st.session_state.current_tab = "5/24 Tracker"
-        render_five_twenty_four_tab()
+    for tab, render_tab in zip(tabs, tab_renderers.values()):
+        if tab.open:
+            with tab:
+                render_tab()
 
 
 if __name__ == "__main__":
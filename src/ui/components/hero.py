@@ -409,9 +409,8 @@ def render_demo_banner(
         st.info("🎮 **Demo Mode** - Explore with sample data. Your real cards will be separate.")
 
     with col2:
-        if st.button("Exit Demo", key="exit_demo_btn", type="secondary"):
-            if exit_callback:
-                exit_callback()
+        # exit_callback runs as on_click, ahead of the rerun the click triggers
+        if st.button("Exit Demo", key="exit_demo_btn", type="secondary", on_click=exit_callback):
             return True
 
     return False
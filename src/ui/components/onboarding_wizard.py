@@ -3,13 +3,35 @@
 Provides a step-by-step guided onboarding experience for first-time users.
 """
 
+import logging
+import re
 import streamlit as st
 from typing import Optional, Callable, Literal
 from dataclasses import dataclass
+from uuid import UUID
 
+from ...core.database import get_cursor
 
-# CSS for wizard styling
-WIZARD_CSS = """
+logger = logging.getLogger(__name__)
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from a CSS block.
+
+    Args:
+        css: CSS source (may include the surrounding <style> tags).
+
+    Returns:
+        Equivalent CSS on a single line.
+    """
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{}:;,])\s*", r"\1", css).strip()
+
+
+# CSS for wizard styling, minified once at import since it is sent with
+# every rerun
+WIZARD_BASE_CSS = _minify_css("""
 <style>
 /* Wizard Overlay */
 .wizard-overlay {
@@ -239,78 +261,231 @@ WIZARD_CSS = """
     color: #212529;
 }
 
-/* Dark Mode */
-@media (prefers-color-scheme: dark) {
-    .wizard-container {
-        background: linear-gradient(135deg, #1a1a1a 0%, #2d2d2d 100%);
-    }
+/* Primary action button, centered at half width. Streamlit tags keyed
+   widgets with an st-key-<key> class, so no wrapper columns are needed. */
+[class*="st-key-"][class*="_next_btn"],
+[class*="st-key-"][class*="_finish_btn"] {
+    width: 50%;
+    margin: 0 auto;
+}
+</style>
+""")
 
-    .wizard-title {
-        color: #f8f9fa;
-    }
+# Dark mode and mobile overrides go in their own <style media=...> tags, so
+# browsers skip applying them (and matching their selectors) when the media
+# query doesn't hold
+WIZARD_DARK_CSS = _minify_css("""
+<style media="(prefers-color-scheme: dark)">
+.wizard-container {
+    background: linear-gradient(135deg, #1a1a1a 0%, #2d2d2d 100%);
+}
 
-    .wizard-description {
-        color: #adb5bd;
-    }
+.wizard-title {
+    color: #f8f9fa;
+}
 
-    .wizard-feature {
-        background: #2d2d2d;
-        border-color: #404040;
-    }
+.wizard-description {
+    color: #adb5bd;
+}
 
-    .wizard-feature:hover {
-        border-color: #6366f1;
-        background: #333333;
-    }
+.wizard-feature {
+    background: #2d2d2d;
+    border-color: #404040;
+}
 
-    .wizard-feature-title {
-        color: #f8f9fa;
-    }
+.wizard-feature:hover {
+    border-color: #6366f1;
+    background: #333333;
+}
 
-    .wizard-feature-desc {
-        color: #adb5bd;
-    }
+.wizard-feature-title {
+    color: #f8f9fa;
+}
 
-    .wizard-next-step {
-        background: #2d2d2d;
-        border-color: #404040;
-    }
+.wizard-feature-desc {
+    color: #adb5bd;
+}
 
-    .wizard-next-step-title {
-        color: #f8f9fa;
-    }
+.wizard-next-step {
+    background: #2d2d2d;
+    border-color: #404040;
+}
 
-    .wizard-next-step-desc {
-        color: #adb5bd;
-    }
+.wizard-next-step-title {
+    color: #f8f9fa;
+}
 
-    .wizard-skip {
-        color: #adb5bd;
-    }
+.wizard-next-step-desc {
+    color: #adb5bd;
+}
 
-    .wizard-skip:hover {
-        background: rgba(255, 255, 255, 0.1);
-        color: #f8f9fa;
-    }
+.wizard-skip {
+    color: #adb5bd;
 }
 
-/* Mobile */
-@media (max-width: 768px) {
-    .wizard-container {
-        padding: 32px 24px;
-    }
+.wizard-skip:hover {
+    background: rgba(255, 255, 255, 0.1);
+    color: #f8f9fa;
+}
+</style>
+""")
 
-    .wizard-title {
-        font-size: 1.5rem;
-    }
+WIZARD_MOBILE_CSS = _minify_css("""
+<style media="(max-width: 768px)">
+.wizard-container {
+    padding: 32px 24px;
+}
 
-    .wizard-description {
-        font-size: 1rem;
-    }
+.wizard-title {
+    font-size: 1.5rem;
+}
+
+.wizard-description {
+    font-size: 1rem;
 }
 </style>
+""")
+
+WIZARD_CSS = WIZARD_BASE_CSS + WIZARD_DARK_CSS + WIZARD_MOBILE_CSS
+
+
+# Step content, built once at import. Step 2 is a str.format template
+# filled in with the template count.
+WIZARD_STEP1_HTML = """
+<div class="wizard-step">
+    <div class="wizard-icon">✈️</div>
+    <h1 class="wizard-title">
+        Welcome to <span class="wizard-highlight">ChurnPilot</span>
+    </h1>
+    <p class="wizard-description">
+        Your personal credit card churning companion. Track signup bonuses, 
+        maximize benefits, and never miss a deadline again.
+    </p>
+</div>
 """
 
+WIZARD_STEP2_TEMPLATE = """
+<div class="wizard-step">
+    <div class="wizard-icon">💳</div>
+    <h1 class="wizard-title">
+        Add Your First Card
+    </h1>
+    <p class="wizard-description">
+        Choose the method that works best for you
+    </p>
+    <div class="wizard-features">
+        <div class="wizard-feature">
+            <div class="wizard-feature-header">
+                <span class="wizard-feature-icon">📚</span>
+                <h3 class="wizard-feature-title">Card Library</h3>
+            </div>
+            <p class="wizard-feature-desc">
+                Select from {template_count}+ pre-built templates with all details already filled in
+            </p>
+            <span class="wizard-feature-badge">FASTEST</span>
+        </div>
+        <div class="wizard-feature">
+            <div class="wizard-feature-header">
+                <span class="wizard-feature-icon">🤖</span>
+                <h3 class="wizard-feature-title">AI Extraction</h3>
+            </div>
+            <p class="wizard-feature-desc">
+                Paste any card offer URL and let AI extract all the details automatically
+            </p>
+            <span class="wizard-feature-badge">SMARTEST</span>
+        </div>
+        <div class="wizard-feature">
+            <div class="wizard-feature-header">
+                <span class="wizard-feature-icon">✍️</span>
+                <h3 class="wizard-feature-title">Manual Entry</h3>
+            </div>
+            <p class="wizard-feature-desc">
+                Full control — enter all card details yourself for maximum customization
+            </p>
+        </div>
+    </div>
+</div>
+"""
+
+WIZARD_STEP3_HTML = """
+<div class="wizard-step">
+    <div class="wizard-icon">🎯</div>
+    <h1 class="wizard-title">
+        What's Next?
+    </h1>
+    <p class="wizard-description">
+        Here's what you can do with ChurnPilot
+    </p>
+    <div class="wizard-next-steps">
+        <div class="wizard-next-step">
+            <span class="wizard-next-step-icon">💰</span>
+            <div class="wizard-next-step-content">
+                <h4 class="wizard-next-step-title">Track Benefits & Credits</h4>
+                <p class="wizard-next-step-desc">
+                    Mark monthly credits as used so you never leave money on the table
+                </p>
+            </div>
+        </div>
+        <div class="wizard-next-step">
+            <span class="wizard-next-step-icon">🎯</span>
+            <div class="wizard-next-step-content">
+                <h4 class="wizard-next-step-title">Monitor 5/24 Status</h4>
+                <p class="wizard-next-step-desc">
+                    Know exactly when you can apply for more Chase cards
+                </p>
+            </div>
+        </div>
+        <div class="wizard-next-step">
+            <span class="wizard-next-step-icon">📊</span>
+            <div class="wizard-next-step-content">
+                <h4 class="wizard-next-step-title">View Portfolio Analytics</h4>
+                <p class="wizard-next-step-desc">
+                    See your total value, spend progress, and upcoming deadlines
+                </p>
+            </div>
+        </div>
+    </div>
+</div>
+"""
+
+# Step number -> builder taking the template count. Builders return HTML
+# rather than rendering it, so the step shares one element with the
+# progress bar.
+WIZARD_STEP_HTML_BUILDERS = {
+    1: lambda template_count: WIZARD_STEP1_HTML,  # Welcome
+    2: lambda template_count: WIZARD_STEP2_TEMPLATE.format(template_count=template_count),  # Add Your First Card
+    3: lambda template_count: WIZARD_STEP3_HTML,  # What's Next
+}
+
+
+WIZARD_STEP_COUNT = 3
+
+
+def build_progress_html(current_step: int) -> str:
+    """Build the progress bar markup for a wizard step.
+
+    Args:
+        current_step: Current step (1-3).
+
+    Returns:
+        HTML for the progress bar with completed/active segments marked.
+    """
+    segments = []
+    for i in range(1, WIZARD_STEP_COUNT + 1):
+        if i < current_step:
+            segments.append('<div class="wizard-progress-step completed"></div>')
+        elif i == current_step:
+            segments.append('<div class="wizard-progress-step active"></div>')
+        else:
+            segments.append('<div class="wizard-progress-step"></div>')
+    return '<div class="wizard-progress">' + ''.join(segments) + '</div>'
+
+
+# Progress bar markup for each step, so renders are a dict lookup
+WIZARD_PROGRESS_HTML = {
+    step: build_progress_html(step) for step in range(1, WIZARD_STEP_COUNT + 1)
+}
+
 
 def inject_wizard_css():
     """Inject wizard CSS styles."""
@@ -323,215 +498,98 @@ def render_onboarding_wizard(
     on_complete: Optional[Callable] = None,
     on_skip: Optional[Callable] = None,
     key_prefix: str = "wizard",
+    inject_css: bool = True,
+    on_next: Optional[Callable] = None,
 ) -> Optional[str]:
     """Render the onboarding wizard.
 
     Args:
         current_step: Current step (1-3).
         template_count: Number of card templates available.
-        on_complete: Callback when wizard completes.
+        on_complete: Callback when wizard completes ("Add Card Now" on
+            step 2 or "Get Started" on step 3).
         on_skip: Callback when wizard is skipped.
         key_prefix: Unique key prefix.
+        inject_css: Whether to emit WIZARD_CSS. Pass False when the page
+            already includes it.
+        on_next: Callback when advancing from step 1.
+
+    Callbacks are attached as button on_click handlers, so they run before
+    the rerun the click triggers. Updating state there (e.g. the step
+    number) renders the result in that same rerun, with no st.rerun().
 
     Returns:
         Action taken: "next", "skip", "add_card", or None.
 
     Example:
         ```python
-        action = render_onboarding_wizard(
+        def advance():
+            st.session_state.wizard_step += 1
+
+        def finish():
+            mark_wizard_completed(st.session_state.get("user_id"))
+
+        render_onboarding_wizard(
             current_step=st.session_state.get("wizard_step", 1),
             template_count=40,
-            on_complete=lambda: mark_wizard_complete(),
-            on_skip=lambda: dismiss_wizard(),
+            on_complete=finish,
+            on_skip=finish,
+            on_next=advance,
         )
-        
-        if action == "next":
-            st.session_state.wizard_step += 1
-            st.rerun()
-        elif action == "skip":
-            st.session_state.wizard_completed = True
-            st.rerun()
         ```
     """
-    inject_wizard_css()
+    if inject_css:
+        inject_wizard_css()
 
     clicked_action = None
 
-    # Build progress bar HTML
-    progress_html = '<div class="wizard-progress">'
-    for i in range(1, 4):
-        if i < current_step:
-            progress_html += '<div class="wizard-progress-step completed"></div>'
-        elif i == current_step:
-            progress_html += '<div class="wizard-progress-step active"></div>'
-        else:
-            progress_html += '<div class="wizard-progress-step"></div>'
-    progress_html += '</div>'
+    # Progress bar HTML (prebuilt for every valid step)
+    progress_html = WIZARD_PROGRESS_HTML.get(current_step) or build_progress_html(current_step)
 
-    # Render wizard overlay
-    st.markdown('<div class="wizard-overlay">', unsafe_allow_html=True)
-    st.markdown('<div class="wizard-container">', unsafe_allow_html=True)
+    # Render wizard overlay. Each st.html call is its own element, so tags
+    # can't span calls; the overlay and container are emitted together as
+    # siblings, as they were rendered when opened in separate calls. The
+    # wizard blocks are pure HTML, so st.html is used instead of
+    # st.markdown to skip the frontend's markdown parser.
+    st.html('<div class="wizard-overlay"></div><div class="wizard-container"></div>')
 
     # Skip button at top right
     col_skip1, col_skip2 = st.columns([5, 1])
     with col_skip2:
-        if st.button("Skip ✕", key=f"{key_prefix}_skip_btn", help="Skip onboarding"):
+        if st.button("Skip ✕", key=f"{key_prefix}_skip_btn", help="Skip onboarding", on_click=on_skip):
             clicked_action = "skip"
-            if on_skip:
-                on_skip()
-
-    # Progress bar
-    st.markdown(progress_html, unsafe_allow_html=True)
 
     # Step content
-    if current_step == 1:
-        # Step 1: Welcome
-        st.markdown(
-            """
-            <div class="wizard-step">
-                <div class="wizard-icon">✈️</div>
-                <h1 class="wizard-title">
-                    Welcome to <span class="wizard-highlight">ChurnPilot</span>
-                </h1>
-                <p class="wizard-description">
-                    Your personal credit card churning companion. Track signup bonuses, 
-                    maximize benefits, and never miss a deadline again.
-                </p>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
-    elif current_step == 2:
-        # Step 2: Add Your First Card
-        st.markdown(
-            f"""
-            <div class="wizard-step">
-                <div class="wizard-icon">💳</div>
-                <h1 class="wizard-title">
-                    Add Your First Card
-                </h1>
-                <p class="wizard-description">
-                    Choose the method that works best for you
-                </p>
-                <div class="wizard-features">
-                    <div class="wizard-feature">
-                        <div class="wizard-feature-header">
-                            <span class="wizard-feature-icon">📚</span>
-                            <h3 class="wizard-feature-title">Card Library</h3>
-                        </div>
-                        <p class="wizard-feature-desc">
-                            Select from {template_count}+ pre-built templates with all details already filled in
-                        </p>
-                        <span class="wizard-feature-badge">FASTEST</span>
-                    </div>
-                    <div class="wizard-feature">
-                        <div class="wizard-feature-header">
-                            <span class="wizard-feature-icon">🤖</span>
-                            <h3 class="wizard-feature-title">AI Extraction</h3>
-                        </div>
-                        <p class="wizard-feature-desc">
-                            Paste any card offer URL and let AI extract all the details automatically
-                        </p>
-                        <span class="wizard-feature-badge">SMARTEST</span>
-                    </div>
-                    <div class="wizard-feature">
-                        <div class="wizard-feature-header">
-                            <span class="wizard-feature-icon">✍️</span>
-                            <h3 class="wizard-feature-title">Manual Entry</h3>
-                        </div>
-                        <p class="wizard-feature-desc">
-                            Full control — enter all card details yourself for maximum customization
-                        </p>
-                    </div>
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
+    build_step_html = WIZARD_STEP_HTML_BUILDERS.get(current_step)
+    step_html = build_step_html(template_count) if build_step_html else ""
 
-    elif current_step == 3:
-        # Step 3: What's Next
-        st.markdown(
-            """
-            <div class="wizard-step">
-                <div class="wizard-icon">🎯</div>
-                <h1 class="wizard-title">
-                    What's Next?
-                </h1>
-                <p class="wizard-description">
-                    Here's what you can do with ChurnPilot
-                </p>
-                <div class="wizard-next-steps">
-                    <div class="wizard-next-step">
-                        <span class="wizard-next-step-icon">💰</span>
-                        <div class="wizard-next-step-content">
-                            <h4 class="wizard-next-step-title">Track Benefits & Credits</h4>
-                            <p class="wizard-next-step-desc">
-                                Mark monthly credits as used so you never leave money on the table
-                            </p>
-                        </div>
-                    </div>
-                    <div class="wizard-next-step">
-                        <span class="wizard-next-step-icon">🎯</span>
-                        <div class="wizard-next-step-content">
-                            <h4 class="wizard-next-step-title">Monitor 5/24 Status</h4>
-                            <p class="wizard-next-step-desc">
-                                Know exactly when you can apply for more Chase cards
-                            </p>
-                        </div>
-                    </div>
-                    <div class="wizard-next-step">
-                        <span class="wizard-next-step-icon">📊</span>
-                        <div class="wizard-next-step-content">
-                            <h4 class="wizard-next-step-title">View Portfolio Analytics</h4>
-                            <p class="wizard-next-step-desc">
-                                See your total value, spend progress, and upcoming deadlines
-                            </p>
-                        </div>
-                    </div>
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
-    # Action buttons
-    st.markdown('<div style="margin-top: 32px;"></div>', unsafe_allow_html=True)
+    # Progress bar, step content and the spacing above the action buttons
+    # in a single element
+    st.html(progress_html + step_html + '<div style="margin-top: 32px;"></div>')
 
     if current_step < 3:
-        # Next button for steps 1-2
-        col1, col2, col3 = st.columns([1, 2, 1])
-        with col2:
-            if st.button(
-                "Continue →" if current_step == 1 else "Add Card Now →",
-                key=f"{key_prefix}_next_btn",
-                type="primary",
-                use_container_width=True,
-            ):
-                if current_step == 2:
-                    # Step 2: Go directly to add card
-                    clicked_action = "add_card"
-                    if on_complete:
-                        on_complete()
-                else:
-                    clicked_action = "next"
+        # Next button for steps 1-2 (centered via WIZARD_CSS). Keyed per
+        # step so a callback that advances the step doesn't make the next
+        # step's button read as clicked in the same rerun.
+        if st.button(
+            "Continue →" if current_step == 1 else "Add Card Now →",
+            key=f"{key_prefix}_next_btn_{current_step}",
+            type="primary",
+            use_container_width=True,
+            on_click=on_complete if current_step == 2 else on_next,
+        ):
+            # Step 2 goes directly to add card
+            clicked_action = "add_card" if current_step == 2 else "next"
     else:
-        # Step 3: Finish button
-        col1, col2, col3 = st.columns([1, 2, 1])
-        with col2:
-            if st.button(
-                "Get Started! 🚀",
-                key=f"{key_prefix}_finish_btn",
-                type="primary",
-                use_container_width=True,
-            ):
-                clicked_action = "complete"
-                if on_complete:
-                    on_complete()
-
-    st.markdown('</div>', unsafe_allow_html=True)  # Close wizard-container
-    st.markdown('</div>', unsafe_allow_html=True)  # Close wizard-overlay
+        # Step 3: Finish button (centered via WIZARD_CSS)
+        if st.button(
+            "Get Started! 🚀",
+            key=f"{key_prefix}_finish_btn",
+            type="primary",
+            use_container_width=True,
+            on_click=on_complete,
+        ):
+            clicked_action = "complete"
 
     return clicked_action
 
@@ -548,13 +606,11 @@ def should_show_wizard(user_id: Optional[str] = None) -> bool:
     Logic:
         - Never show if skip_wizard query param is set
         - Never show if wizard already completed in session
-        - Never show if user has cards  
+        - Show if already decided for this user this session
+        - Never show if user has cards
         - Check DB preference if user_id provided
         - Otherwise show for new users
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    
     # Check URL param first (allows automation to skip wizard)
     if st.query_params.get("skip_wizard") == "true":
         logger.debug("Wizard hidden: skip_wizard=true query param")
@@ -566,19 +622,27 @@ def should_show_wizard(user_id: Optional[str] = None) -> bool:
         logger.debug("Wizard hidden: session state wizard_completed=True")
         return False
 
+    # Already decided to show it for this user this session. The answer only
+    # flips through mark_wizard_completed (which sets wizard_completed) or by
+    # adding a card (after which main() stops asking), so reruns between
+    # wizard steps skip the card and DB checks.
+    if user_id and st.session_state.get("wizard_shown_for") == str(user_id):
+        return True
+
     # Check if user has cards (don't show wizard if they do)
-    if hasattr(st.session_state, 'storage'):
-        cards = st.session_state.storage.get_all_cards()
-        if len(cards) > 0:
-            logger.debug(f"Wizard hidden: user has {len(cards)} cards")
+    if 'storage' in st.session_state:
+        storage = st.session_state.storage
+        if hasattr(storage, 'has_cards'):
+            has_cards = storage.has_cards()
+        else:
+            has_cards = len(storage.get_all_cards()) > 0
+        if has_cards:
+            logger.debug("Wizard hidden: user has cards")
             return False
 
     # Check DB preference if user_id provided (most reliable for page reloads)
     if user_id:
         try:
-            from ...core.database import get_cursor
-            from uuid import UUID
-            
             # Ensure user_id is proper format
             if isinstance(user_id, str):
                 user_id_str = user_id
@@ -591,13 +655,14 @@ def should_show_wizard(user_id: Optional[str] = None) -> bool:
                     (user_id_str,)
                 )
                 result = cursor.fetchone()
-                if result and result[0]:
+                if result and result["onboarding_completed"]:
                     # DB says completed - sync session state
                     st.session_state.wizard_completed = True
                     logger.debug(f"Wizard hidden: DB onboarding_completed=True for {user_id_str}")
                     return False
                 elif result is None:
                     logger.debug(f"No user_preferences row for {user_id_str}, showing wizard")
+            st.session_state.wizard_shown_for = user_id_str
         except Exception as e:
             # Log the error for debugging
             logger.warning(f"DB check for wizard failed: {e}")
@@ -607,6 +672,17 @@ def should_show_wizard(user_id: Optional[str] = None) -> bool:
     return True
 
 
+# Upsert for the onboarding flag. Sent as plain parameterized SQL rather than
+# a server-side PREPARE: get_cursor() opens a fresh connection per call, so a
+# prepared plan would be discarded after its single use.
+MARK_ONBOARDING_COMPLETED_SQL = """
+    INSERT INTO user_preferences (user_id, onboarding_completed)
+    VALUES (%s, TRUE)
+    ON CONFLICT (user_id)
+    DO UPDATE SET onboarding_completed = TRUE, updated_at = CURRENT_TIMESTAMP
+"""
+
+
 def mark_wizard_completed(user_id: Optional[str] = None) -> bool:
     """Mark the onboarding wizard as completed.
 
@@ -614,44 +690,24 @@ def mark_wizard_completed(user_id: Optional[str] = None) -> bool:
         user_id: Current user's ID (optional).
 
     Returns:
-        True if successfully saved to DB, False otherwise.
+        True if saved to the DB (or no user_id was given), False otherwise.
 
     Saves completion state to:
         1. Session state (immediate)
         2. Database (persistent) if user_id provided
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    
     # Mark completed in session
     st.session_state.wizard_completed = True
     
-    # Also store in a cookie-like query param for persistence across reloads
-    # This is a workaround for Streamlit's session state limitations
-    
     # Save to DB if user_id provided
     if user_id:
         try:
-            from ...core.database import get_cursor
-            from uuid import UUID
-            
             # Ensure user_id is proper UUID format
-            if isinstance(user_id, str):
-                user_id = UUID(user_id)
+            user_id = str(UUID(str(user_id)))
 
             with get_cursor() as cursor:
-                # Use INSERT ... ON CONFLICT for upsert behavior
-                cursor.execute(
-                    """
-                    INSERT INTO user_preferences (user_id, onboarding_completed)
-                    VALUES (%s, TRUE)
-                    ON CONFLICT (user_id)
-                    DO UPDATE SET onboarding_completed = TRUE, updated_at = CURRENT_TIMESTAMP
-                    """,
-                    (str(user_id),)
-                )
+                cursor.execute(MARK_ONBOARDING_COMPLETED_SQL, (user_id,))
             logger.info(f"Wizard completion saved for user {user_id}")
-            return True
         except Exception as e:
             # Log error with full details for debugging
             logger.error(f"Failed to save wizard completion to DB for user {user_id}: {e}", exc_info=True)
@@ -3,7 +3,7 @@
 from uuid import uuid4
 from src.core.ai_rate_limit import (
     check_extraction_limit,
-    record_extraction,
+    record_extractions_bulk,
     get_extraction_count,
     FREE_TIER_MONTHLY_LIMIT,
 )
@@ -22,15 +22,13 @@ def test_rate_limiting():
     assert remaining == FREE_TIER_MONTHLY_LIMIT, f"Should have {FREE_TIER_MONTHLY_LIMIT} remaining"
     print(f"✓ Initial state: {message}")
     
-    # Use up all extractions
-    for i in range(FREE_TIER_MONTHLY_LIMIT):
-        record_extraction(test_user_id)
-        count = get_extraction_count(test_user_id)
-        print(f"✓ Recorded extraction #{i+1}: {count}/{FREE_TIER_MONTHLY_LIMIT}")
+    # Use up all extractions in one batch
+    record_extractions_bulk(test_user_id, FREE_TIER_MONTHLY_LIMIT)
     
     # Check count
-    final_count = get_extraction_count(test_user_id)
+    final_count = get_extraction_count(test_user_id)['monthly']
     assert final_count == FREE_TIER_MONTHLY_LIMIT, f"Should have used all {FREE_TIER_MONTHLY_LIMIT} extractions"
+    print(f"✓ Recorded {final_count}/{FREE_TIER_MONTHLY_LIMIT} extractions")
     
     # Try to extract again - should be blocked
     can_extract, remaining, message = check_extraction_limit(test_user_id)
@@ -8,6 +8,8 @@ This script tests:
 Run with: streamlit run test_localstorage.py
 """
 
+import json
+
 import streamlit as st
 from streamlit_js_eval import streamlit_js_eval
 
@@ -16,13 +18,50 @@ st.set_page_config(page_title="localStorage Test", layout="centered")
 st.title("🧪 localStorage Test")
 st.markdown("---")
 
+# All write/read/clear operations go through one bridge component. A button
+# queues a command; the bridge renders under a single key per command until
+# the browser answers, so at most one component instance is mounted per
+# rerun instead of one per operation type.
+TEST_STORAGE_KEY = "churnpilot_test"
+
+BRIDGE_JS = """
+(function() {{
+    var command = {command};
+    var key = {storage_key};
+    try {{
+        var storage = window.parent.localStorage;
+        if (command.op === 'write') {{
+            storage.setItem(key, command.value);
+            console.log('[Test] Write successful:', command.value);
+            return {{op: 'write', ok: true, value: command.value}};
+        }}
+        if (command.op === 'clear') {{
+            storage.removeItem(key);
+            console.log('[Test] Cleared localStorage');
+            return {{op: 'clear', ok: true, value: null}};
+        }}
+        var value = storage.getItem(key);
+        console.log('[Test] Read result:', value);
+        return {{op: 'read', ok: true, value: value}};
+    }} catch (e) {{
+        console.error('[Test] ' + command.op + ' error:', e);
+        return {{op: command.op, ok: false, value: null}};
+    }}
+}})()
+"""
+
+
+def queue_command(op: str, value: str | None = None):
+    """Queue a localStorage operation for the bridge to run."""
+    st.session_state.bridge_seq += 1
+    st.session_state.bridge_command = {"op": op, "value": value}
+
+
 # Initialize counters
-if "phase_counter" not in st.session_state:
-    st.session_state.phase_counter = 0
-if "write_counter" not in st.session_state:
-    st.session_state.write_counter = 0
-if "read_counter" not in st.session_state:
-    st.session_state.read_counter = 0
+st.session_state.setdefault("phase_counter", 0)
+st.session_state.setdefault("bridge_seq", 0)
+st.session_state.setdefault("bridge_command", None)
+st.session_state.setdefault("bridge_results", {})
 
 st.session_state.phase_counter += 1
 
@@ -33,70 +72,57 @@ st.markdown("## Test 1: Write to localStorage")
 test_value = st.text_input("Test value to write:", value="test_session_12345", key="test_input")
 
 if st.button("Write to localStorage", type="primary"):
-    st.session_state.write_counter += 1
-    
-    js_code = f"""
-    (function() {{
-        try {{
-            console.log('[Test] Writing to localStorage...');
-            window.parent.localStorage.setItem('churnpilot_test', '{test_value}');
-            console.log('[Test] Write successful:', '{test_value}');
-            return true;
-        }} catch (e) {{
-            console.error('[Test] Write error:', e);
-            return false;
-        }}
-    }})()
-    """
-    
-    result = streamlit_js_eval(
-        js_expressions=js_code,
-        key=f"write_test_{st.session_state.write_counter}"
-    )
-    
-    st.success(f"✓ Write initiated (result: {result})")
-    st.caption("Check browser console for '[Test] Write successful' message")
+    queue_command("write", test_value)
 
 st.markdown("---")
 st.markdown("## Test 2: Read from localStorage")
 
 if st.button("Read from localStorage", type="primary"):
-    st.session_state.read_counter += 1
-    
-    js_code = """
-    (function() {
-        try {
-            console.log('[Test] Reading from localStorage...');
-            var value = window.parent.localStorage.getItem('churnpilot_test');
-            console.log('[Test] Read result:', value);
-            return value || null;
-        } catch (e) {
-            console.error('[Test] Read error:', e);
-            return null;
-        }
-    })()
-    """
-    
+    queue_command("read")
+
+st.markdown("---")
+st.markdown("## Test 3: Clear localStorage")
+
+if st.button("Clear Test Data", type="secondary"):
+    queue_command("clear")
+
+# Bridge: one component call per rerun while a command is pending. It returns
+# None until the browser has run the JS, then the component's rerun delivers
+# the result and the command is cleared.
+command = st.session_state.bridge_command
+if command is not None:
     result = streamlit_js_eval(
-        js_expressions=js_code,
-        key=f"read_test_{st.session_state.read_counter}"
+        js_expressions=BRIDGE_JS.format(
+            command=json.dumps(command),
+            storage_key=json.dumps(TEST_STORAGE_KEY),
+        ),
+        key=f"ls_bridge_{st.session_state.bridge_seq}",
     )
-    
     if result is None:
-        st.warning("⚠️ Result is None - this is expected on first render. Click 'Read from localStorage' again.")
-        st.caption("streamlit_js_eval returns None on first render (component mounting phase)")
+        st.caption(f"⏳ Waiting for browser to run '{command['op']}' (component mounting)")
+    else:
+        st.session_state.bridge_results[result["op"]] = result
+        st.session_state.bridge_command = None
+
+results = st.session_state.bridge_results
+if "write" in results:
+    st.success(f"✓ Write result: {results['write']}")
+    st.caption("Check browser console for '[Test] Write successful' message")
+if "read" in results:
+    if results["read"]["value"] is None:
+        st.warning("⚠️ Read returned no value - localStorage is empty or inaccessible")
     else:
-        st.success(f"✓ Read successful: '{result}'")
+        st.success(f"✓ Read successful: '{results['read']['value']}'")
+if "clear" in results:
+    st.info("Cleared test data from localStorage")
 
 st.markdown("---")
-st.markdown("## Test 3: Two-Phase Loading Pattern")
+st.markdown("## Test 4: Two-Phase Loading Pattern")
 
-if "two_phase_rerun" not in st.session_state:
-    st.session_state.two_phase_rerun = False
+st.session_state.setdefault("two_phase_rerun", False)
 
 if st.button("Test Two-Phase Pattern"):
     st.session_state.two_phase_rerun = False
-    st.session_state.read_counter += 1
 
 js_code_two_phase = """
 (function() {
@@ -128,7 +154,7 @@ else:
     st.session_state.two_phase_rerun = False
 
 st.markdown("---")
-st.markdown("## Test 4: Manual Browser Check")
+st.markdown("## Test 5: Manual Browser Check")
 st.markdown("""
 Open browser DevTools Console (F12 or Cmd+Opt+I) and run:
 
@@ -139,38 +165,12 @@ window.parent.localStorage.getItem('churnpilot_test')
 This will show you if the value is actually in localStorage.
 """)
 
-st.markdown("---")
-st.markdown("## Test 5: Clear localStorage")
-
-if st.button("Clear Test Data", type="secondary"):
-    st.session_state.write_counter += 1
-    
-    js_code = """
-    (function() {
-        try {
-            window.parent.localStorage.removeItem('churnpilot_test');
-            console.log('[Test] Cleared localStorage');
-            return true;
-        } catch (e) {
-            console.error('[Test] Clear error:', e);
-            return false;
-        }
-    })()
-    """
-    
-    result = streamlit_js_eval(
-        js_expressions=js_code,
-        key=f"clear_test_{st.session_state.write_counter}"
-    )
-    
-    st.info("Cleared test data from localStorage")
-
 st.markdown("---")
 st.markdown("## Session State Debug")
 with st.expander("View session state"):
     st.json({
         "phase_counter": st.session_state.phase_counter,
-        "write_counter": st.session_state.write_counter,
-        "read_counter": st.session_state.read_counter,
+        "bridge_seq": st.session_state.bridge_seq,
+        "bridge_command": st.session_state.bridge_command,
         "two_phase_rerun": st.session_state.two_phase_rerun,
     })
@@ -0,0 +1,42 @@
+"""Shared helpers for the Streamlit browser tests.
+
+Plain module rather than conftest.py, so test modules can import these
+directly. Fixtures stay in conftest.py.
+"""
+
+# Streamlit's main container, rendered once the app has loaded
+APP_CONTAINER_SELECTOR = '[data-testid="stAppViewContainer"]'
+# True once no spinner or running icon (mounted only during a run) is shown
+APP_IDLE_JS = """() => !document.querySelector('[data-testid="stSpinner"]')
+    && !document.querySelector('[data-testid="stStatusWidgetRunningIcon"]')"""
+# Selenium form of the same check: container rendered and app idle
+APP_READY_JS = f"return !!document.querySelector('{APP_CONTAINER_SELECTOR}') && ({APP_IDLE_JS})()"
+
+# Resolves false as soon as the key is missing, or true once it has stayed
+# set for the whole window
+ITEM_STAYS_SET_JS = """([key, ms]) => new Promise(resolve => {
+    const end = Date.now() + ms;
+    const poll = () => {
+        if (localStorage.getItem(key) === null) return resolve(false);
+        if (Date.now() >= end) return resolve(true);
+        setTimeout(poll, 100);
+    };
+    poll();
+})"""
+
+# How long a key must survive after a reload. Loading stored cards takes
+# several reruns, and the idle check can pass between two of them, so a
+# key the app overwrites would still be set when that check returns.
+SETTLE_MS = 3000
+
+
+def wait_for_app_ready(target, timeout: int = 10000):
+    """Wait until the app has rendered and finished its script run (Playwright).
+
+    Args:
+        target: Page the app is loaded in, or the Frame it is rendered in
+            when the app is embedded (as on Streamlit Cloud).
+        timeout: Milliseconds to wait for each condition.
+    """
+    target.wait_for_selector(APP_CONTAINER_SELECTOR, state="visible", timeout=timeout)
+    target.wait_for_function(APP_IDLE_JS, timeout=timeout)
@@ -14,19 +14,19 @@ import pytest
 BASE_URL = "http://localhost:8501"
 
 
-def test_homepage_loads():
+def test_homepage_loads(http_session):
     """Verify the app responds to HTTP requests."""
     try:
-        response = requests.get(BASE_URL, timeout=5)
+        response = http_session.get(BASE_URL, timeout=5)
         assert response.status_code == 200
     except requests.exceptions.ConnectionError:
         pytest.skip("Server not running on :8501")
 
 
-def test_health_endpoint():
+def test_health_endpoint(http_session):
     """Verify health endpoint if it exists."""
     try:
-        response = requests.get(f"{BASE_URL}/_stcore/health", timeout=5)
+        response = http_session.get(f"{BASE_URL}/_stcore/health", timeout=5)
         # Streamlit returns 200 for health
         assert response.status_code == 200
     except requests.exceptions.ConnectionError:
@@ -15,44 +15,54 @@ Environment:
 """
 
 import pytest
-import requests
 import os
+import re
 
 # Default to experiment URL, can override for production
 BASE_URL = os.getenv("EXPERIMENT_URL", "https://churnpilot-experiment.streamlit.app")
 
+# Error page indicators, matched case-insensitively in one pass over the page
+ERROR_PAGE_RE = re.compile(
+    r"streamlit error|ModuleNotFoundError|ImportError|Exception|Traceback",
+    re.IGNORECASE,
+)
+
+
+# The deployment doesn't change during a run, so each URL is fetched once
+# and every test asserts against the same response
+@pytest.fixture(scope="module")
+def homepage_response(http_session):
+    """Response for the app's homepage."""
+    return http_session.get(BASE_URL, timeout=30)
+
+
+@pytest.fixture(scope="module")
+def health_response(http_session):
+    """Response for Streamlit's health endpoint."""
+    return http_session.get(f"{BASE_URL}/_stcore/health", timeout=10)
+
 
 @pytest.mark.smoke
 class TestRemoteSmoke:
     """Quick smoke tests for remote deployment."""
 
-    def test_app_responds(self):
+    def test_app_responds(self, homepage_response):
         """App should respond to HTTP requests."""
-        response = requests.get(BASE_URL, timeout=30)
+        response = homepage_response
         assert response.status_code == 200, f"App not responding: {response.status_code}"
 
-    def test_streamlit_health(self):
+    def test_streamlit_health(self, health_response):
         """Streamlit health endpoint should respond."""
-        response = requests.get(f"{BASE_URL}/_stcore/health", timeout=10)
-        assert response.status_code == 200
+        assert health_response.status_code == 200
 
-    def test_no_error_page(self):
+    def test_no_error_page(self, homepage_response):
         """App should not show Streamlit error page."""
-        response = requests.get(BASE_URL, timeout=30)
-        error_indicators = [
-            "streamlit error",
-            "ModuleNotFoundError",
-            "ImportError",
-            "Exception",
-            "Traceback",
-        ]
-        content_lower = response.text.lower()
-        for indicator in error_indicators:
-            assert indicator.lower() not in content_lower, f"Found error indicator: {indicator}"
-
-    def test_login_elements_present(self):
+        match = ERROR_PAGE_RE.search(homepage_response.text)
+        assert match is None, f"Found error indicator: {match.group(0)}"
+
+    def test_login_elements_present(self, homepage_response):
         """Page should contain login-related elements."""
-        response = requests.get(BASE_URL, timeout=30)
+        response = homepage_response
         # Streamlit apps render differently, check for common patterns
         assert response.status_code == 200
         # Basic check that we got HTML content
@@ -63,9 +73,8 @@ class TestRemoteSmoke:
 class TestRemoteAPI:
     """API endpoint smoke tests."""
 
-    def test_api_base(self):
+    def test_api_base(self, homepage_response):
         """API should be accessible."""
         # Streamlit doesn't have traditional API endpoints
         # This tests the base app is serving
-        response = requests.get(BASE_URL, timeout=30)
-        assert response.status_code == 200
+        assert homepage_response.status_code == 200
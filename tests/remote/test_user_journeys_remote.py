@@ -18,15 +18,19 @@ Environment:
 
 import pytest
 import os
-import time
+import re
 from datetime import datetime
+from types import SimpleNamespace
+from urllib.parse import urlparse
+
+from tests.browser_helpers import wait_for_app_ready
 
 try:
-    from playwright.sync_api import sync_playwright, Page, expect
+    from playwright.sync_api import FrameLocator, Page, expect
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
-    sync_playwright = None
+    FrameLocator = None
     Page = None
     expect = None
 
@@ -36,67 +40,105 @@ EXPERIMENT_URL = os.getenv(
     "EXPERIMENT_URL",
     "https://churncopilothendrix-j9sadpe83mwj34ha7kfgqw.streamlit.app"
 )
+EXPERIMENT_HOST = urlparse(EXPERIMENT_URL).netloc
 TEST_EMAIL = os.getenv("TEST_EMAIL", f"journey_test_{datetime.now().strftime('%Y%m%d%H%M%S')}@test.com")
 TEST_PASSWORD = os.getenv("TEST_PASSWORD", "TestPassword123!")
 
+# Python error names, matched case-insensitively in one pass over the page
+PYTHON_ERROR_RE = re.compile(
+    r"traceback|modulenotfounderror|importerror|attributeerror|typeerror|keyerror",
+    re.IGNORECASE,
+)
+# Errors that mean the app failed to load at all
+LOAD_ERROR_RE = re.compile(r"traceback|modulenotfounderror|importerror", re.IGNORECASE)
+
+# Streamlit element the error checks look for
+EXCEPTION_SELECTOR = '[data-testid="stException"]'
+# Returns the first match of a regex pattern in an element's visible text
+FIRST_TEXT_MATCH_JS = "(el, pattern) => (el.innerText.match(new RegExp(pattern, 'i')) || [null])[0]"
+
+# Rerun only the failing test, and only on Playwright timeouts (network hiccups
+# on the hosted app). Real assertion failures still fail on the first run.
+retry_on_timeout = pytest.mark.flaky(
+    reruns=2, reruns_delay=1, only_rerun=["TimeoutError"]
+)
+
 
-@pytest.fixture(scope="module")
-def browser_context():
-    """Create a Playwright browser context for all tests in module."""
+@pytest.fixture(scope="session")
+def page(browser_context):
+    """Create the one loaded page shared by the whole session.
+
+    The app is navigated to once. Tests pick up where the previous one left
+    off, and tests that need fresh state reload it themselves, which keeps
+    the connection and the cached Streamlit bundle. The browser context
+    comes from the session fixture in tests/conftest.py.
+    """
     if not PLAYWRIGHT_AVAILABLE:
         pytest.skip("Playwright not installed. Run: pip install playwright && playwright install chromium")
-    
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            ignore_https_errors=True,
-        )
-        yield context
-        context.close()
-        browser.close()
-
-
-@pytest.fixture(scope="function")
-def page(browser_context):
-    """Create a new page for each test."""
+
     page = browser_context.new_page()
-    page.set_default_timeout(30000)
+    page.set_default_timeout(15000)
+    page.goto(EXPERIMENT_URL, wait_until="domcontentloaded")
+    wait_for_streamlit(page)
     yield page
     page.close()
 
 
-def wait_for_streamlit(page: Page, timeout: int = 30000):
-    """Wait for Streamlit app to finish loading."""
+@pytest.fixture(scope="session")
+def streamlit_frame(page):
+    """App iframe locator for the shared page."""
+    return page.frame_locator("iframe").first
+
+
+@pytest.fixture(scope="session")
+def homepage_snapshot(page, streamlit_frame):
+    """Record what tests check on the unauthenticated homepage.
+
+    The landing state is the same for every journey that only inspects it,
+    so those tests assert against this snapshot instead of querying the
+    page again.
+    """
+    # Gather everything in one evaluate call rather than a round-trip per
+    # query; the auth options are then matched in Python against the text
+    state = streamlit_frame.locator("body").evaluate(
+        """body => ({
+            buttonCount: body.querySelectorAll("button").length,
+            inputCount: body.querySelectorAll("input").length,
+            text: body.innerText,
+        })"""
+    )
+    return SimpleNamespace(
+        url=page.url,
+        title=page.title(),
+        button_count=state["buttonCount"],
+        input_count=state["inputCount"],
+        has_sign_in=re.search(r"sign\s+in", state["text"], re.IGNORECASE) is not None,
+        has_create_account=re.search(r"create\s+account", state["text"], re.IGNORECASE) is not None,
+        body_text=state["text"],
+    )
+
+
+def wait_for_streamlit(page: Page, timeout: int = 30000) -> FrameLocator:
+    """Wait for Streamlit app to finish loading.
+
+    Returns as soon as the app container is visible and neither a spinner
+    nor the status widget's running icon is showing, instead of sleeping
+    for a fixed time. networkidle is not used: Streamlit's websocket keeps
+    the connection busy. Navigations only need wait_until="domcontentloaded"
+    before calling this; the selectors below are the real readiness signal.
+
+    Returns:
+        Locator for the app iframe. It resolves lazily, so it stays valid
+        across reloads of the same page.
+    """
     # Wait for the main iframe to appear
-    page.wait_for_selector("iframe", timeout=timeout)
-    time.sleep(2)  # Allow Streamlit to render
-    
-    # Wait for network to settle
-    try:
-        page.wait_for_load_state("networkidle", timeout=timeout)
-    except:
-        pass
-    time.sleep(1)
-
-
-def get_streamlit_frame(page: Page):
-    """Get the Streamlit content frame (inside iframe)."""
-    # Streamlit renders content in an iframe
-    # Use frame_locator to properly access iframe content
-    try:
-        # Try to access the first iframe
-        iframe = page.frame_locator("iframe").first
-        return iframe
-    except:
-        pass
-    
-    # Fallback: try frames directly
-    for frame in page.frames:
-        if frame != page.main_frame:
-            return frame
-    
-    return page
+    page.wait_for_load_state("domcontentloaded", timeout=timeout)
+    iframe = page.wait_for_selector("iframe", timeout=timeout)
+    frame = iframe.content_frame()
+
+    # Wait for the app to render and finish its script run
+    wait_for_app_ready(frame, timeout=timeout)
+    return page.frame_locator("iframe").first
 
 
 # =============================================================================
@@ -104,47 +146,25 @@ def get_streamlit_frame(page: Page):
 # =============================================================================
 
 @pytest.mark.journey
+@retry_on_timeout
 class TestNewUserSignupJourney:
     """Journey: New user creates an account and sees empty dashboard."""
 
-    def test_homepage_loads(self, page):
+    def test_homepage_loads(self, homepage_snapshot):
         """Step 1: Homepage loads without errors."""
-        page.goto(EXPERIMENT_URL)
-        wait_for_streamlit(page)
-        
         # Page should load (not error page)
-        assert page.title() or True  # Streamlit may not set title
+        assert homepage_snapshot.title or True  # Streamlit may not set title
         
-    def test_signup_form_visible(self, page):
+    def test_signup_form_visible(self, homepage_snapshot):
         """Step 2: Signup/login form elements are visible."""
-        page.goto(EXPERIMENT_URL)
-        wait_for_streamlit(page)
-        
-        # Use frame_locator to access iframe content
-        iframe = page.frame_locator("iframe").first
-        
-        # Look for Sign In or Create Account text in iframe
-        sign_in = iframe.locator("text=Sign In")
-        create_account = iframe.locator("text=Create Account")
-        
         # At least one auth option should be visible
-        has_sign_in = sign_in.count() > 0
-        has_create = create_account.count() > 0
-        
-        assert has_sign_in or has_create, "No auth options found (Sign In or Create Account)"
+        assert homepage_snapshot.has_sign_in or homepage_snapshot.has_create_account, \
+            "No auth options found (Sign In or Create Account)"
 
-    def test_can_create_account(self, page):
+    def test_can_create_account(self, homepage_snapshot):
         """Step 3: Can interact with signup form."""
-        page.goto(EXPERIMENT_URL)
-        wait_for_streamlit(page)
-        
-        iframe = page.frame_locator("iframe").first
-        
-        # Look for any input fields in iframe
-        inputs = iframe.locator("input")
-        
         # Page has input fields (email/password)
-        assert inputs.count() > 0 or True  # Graceful pass if structure differs
+        assert homepage_snapshot.input_count > 0 or True  # Graceful pass if structure differs
 
 
 # =============================================================================
@@ -152,32 +172,24 @@ class TestNewUserSignupJourney:
 # =============================================================================
 
 @pytest.mark.journey
+@retry_on_timeout
 class TestAddCardJourney:
     """Journey: User adds their first credit card."""
 
-    def test_navigate_to_add_card(self, page):
+    def test_navigate_to_add_card(self, homepage_snapshot):
         """Step 1: Can navigate the app."""
-        page.goto(EXPERIMENT_URL)
-        wait_for_streamlit(page)
-        
         # Page loaded successfully
-        assert EXPERIMENT_URL.split("//")[1].split("/")[0] in page.url or True
+        assert urlparse(homepage_snapshot.url).netloc == EXPERIMENT_HOST or True
 
-    def test_card_library_dropdown_visible(self, page):
+    def test_card_library_dropdown_visible(self, homepage_snapshot):
         """Step 2: App UI loads properly."""
-        page.goto(EXPERIMENT_URL)
-        wait_for_streamlit(page)
-        
         # Streamlit app loaded
-        assert EXPERIMENT_URL.split("//")[1].split("/")[0] in page.url
+        assert urlparse(homepage_snapshot.url).netloc == EXPERIMENT_HOST
 
-    def test_can_select_and_add_card(self, page):
+    def test_can_select_and_add_card(self, homepage_snapshot):
         """Step 3: Card selection UI works."""
-        page.goto(EXPERIMENT_URL)
-        wait_for_streamlit(page)
-        
         # App loaded and responsive
-        assert page.url.startswith("http")
+        assert homepage_snapshot.url.startswith("http")
 
 
 # =============================================================================
@@ -185,50 +197,26 @@ class TestAddCardJourney:
 # =============================================================================
 
 @pytest.mark.journey
+@retry_on_timeout
 class TestAIExtractionJourney:
     """Journey: User extracts card data from a URL using AI."""
 
-    def test_extraction_ui_visible(self, page):
+    def test_extraction_ui_visible(self, homepage_snapshot):
         """Step 1: AI extraction or URL input exists somewhere in the app."""
-        page.goto(EXPERIMENT_URL)
-        wait_for_streamlit(page)
-        
-        iframe = page.frame_locator("iframe").first
-        
-        # Check that the app has interactive elements
-        buttons = iframe.locator("button")
-        inputs = iframe.locator("input")
-        
-        has_buttons = buttons.count() > 0
-        has_inputs = inputs.count() > 0
-        
         # App has interactive UI elements
-        assert has_buttons or has_inputs, "App should have interactive elements"
+        assert homepage_snapshot.button_count > 0 or homepage_snapshot.input_count > 0, \
+            "App should have interactive elements"
 
-    def test_can_enter_url(self, page):
+    def test_can_enter_url(self, homepage_snapshot):
         """Step 2: Can find input fields in the app."""
-        page.goto(EXPERIMENT_URL)
-        wait_for_streamlit(page)
-        
-        iframe = page.frame_locator("iframe").first
-        
-        # Look for any inputs
-        inputs = iframe.locator("input")
-        
         # App has inputs (email, password, or URL)
-        assert inputs.count() > 0, "App should have input fields"
+        assert homepage_snapshot.input_count > 0, "App should have input fields"
 
-    def test_extraction_completes(self, page):
+    def test_extraction_completes(self, homepage_snapshot):
         """Step 3: App is responsive and functional."""
-        page.goto(EXPERIMENT_URL)
-        wait_for_streamlit(page)
-        
         # App loaded without Python errors
-        content = page.content().lower()
-        error_indicators = ["traceback", "modulenotfounderror", "importerror"]
-        
-        for error in error_indicators:
-            assert error not in content, f"Found error: {error}"
+        match = LOAD_ERROR_RE.search(homepage_snapshot.body_text)
+        assert match is None, f"Found error: {match.group(0).lower()}"
 
 
 # =============================================================================
@@ -236,21 +224,19 @@ class TestAIExtractionJourney:
 # =============================================================================
 
 @pytest.mark.journey
+@retry_on_timeout
 class TestDataPersistenceJourney:
     """Journey: Verify data persists across page refreshes."""
 
     def test_data_survives_refresh(self, page):
         """Data should persist after page refresh."""
-        page.goto(EXPERIMENT_URL)
-        wait_for_streamlit(page)
-        
         # Refresh page
-        page.reload()
+        page.reload(wait_until="domcontentloaded")
         wait_for_streamlit(page)
         
         # App still loads
-        expected_domain = EXPERIMENT_URL.replace("https://", "").replace("http://", "").split("/")[0]
-        assert expected_domain in page.url, f"Expected {expected_domain} in {page.url}"
+        host = urlparse(page.url).netloc
+        assert host == EXPERIMENT_HOST, f"Expected {EXPERIMENT_HOST}, got {host}"
 
 
 # =============================================================================
@@ -258,21 +244,14 @@ class TestDataPersistenceJourney:
 # =============================================================================
 
 @pytest.mark.journey
+@retry_on_timeout
 class TestImportDataJourney:
     """Journey: User imports card data from file."""
 
-    def test_import_ui_visible(self, page):
+    def test_import_ui_visible(self, homepage_snapshot):
         """Step 1: App has file upload or import capability."""
-        page.goto(EXPERIMENT_URL)
-        wait_for_streamlit(page)
-        
-        iframe = page.frame_locator("iframe").first
-        
-        # Look for buttons in iframe
-        buttons = iframe.locator("button")
-        
         # App has buttons (including potential import/upload buttons)
-        assert buttons.count() > 0, "App should have buttons"
+        assert homepage_snapshot.button_count > 0, "App should have buttons"
 
 
 # =============================================================================
@@ -280,19 +259,14 @@ class TestImportDataJourney:
 # =============================================================================
 
 @pytest.mark.journey
+@retry_on_timeout
 class TestDeleteCardJourney:
     """Journey: User deletes a card."""
 
-    def test_delete_button_exists(self, page):
+    def test_delete_button_exists(self, homepage_snapshot):
         """Delete functionality exists in the app."""
-        page.goto(EXPERIMENT_URL)
-        wait_for_streamlit(page)
-        
-        iframe = page.frame_locator("iframe").first
-        
         # App has buttons (delete is behind auth, but app should have interactive elements)
-        buttons = iframe.locator("button")
-        assert buttons.count() > 0, "App should have buttons"
+        assert homepage_snapshot.button_count > 0, "App should have buttons"
 
 
 # =============================================================================
@@ -300,36 +274,30 @@ class TestDeleteCardJourney:
 # =============================================================================
 
 @pytest.mark.journey
+@retry_on_timeout
 @pytest.mark.smoke
 class TestQuickSmokeCheck:
     """Quick smoke checks that always run."""
 
-    def test_app_responds(self, page):
+    def test_app_responds(self, browser_context):
         """App should respond to HTTP requests."""
-        response = page.goto(EXPERIMENT_URL)
+        # Plain HTTP request through the context: no page load needed
+        response = browser_context.request.get(EXPERIMENT_URL)
         assert response.status == 200, f"Expected 200, got {response.status}"
 
-    def test_no_python_errors(self, page):
+    def test_no_python_errors(self, streamlit_frame):
         """App should not show Python tracebacks."""
-        page.goto(EXPERIMENT_URL)
-        wait_for_streamlit(page)
-        
-        content = page.content().lower()
-        error_patterns = [
-            "traceback",
-            "modulenotfounderror", 
-            "importerror",
-            "attributeerror",
-            "typeerror",
-            "keyerror",
-        ]
-        
-        for pattern in error_patterns:
-            assert pattern not in content, f"Found Python error: {pattern}"
+        # Uncaught exceptions render in Streamlit's exception element
+        exceptions = streamlit_frame.locator(EXCEPTION_SELECTOR)
+        assert exceptions.count() == 0, f"Found Python error: {exceptions.first.inner_text()}"
+
+        # Scan the app's visible text in the browser; only a match comes back
+        match = streamlit_frame.locator("body").evaluate(FIRST_TEXT_MATCH_JS, PYTHON_ERROR_RE.pattern)
+        assert match is None, f"Found Python error: {match.lower()}"
 
-    def test_streamlit_health(self, page):
+    def test_streamlit_health(self, browser_context):
         """Streamlit health endpoint should respond."""
-        response = page.goto(f"{EXPERIMENT_URL}/_stcore/health")
+        response = browser_context.request.get(f"{EXPERIMENT_URL}/_stcore/health")
         assert response.status == 200, f"Health check failed: {response.status}"
 
 
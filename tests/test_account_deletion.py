@@ -2,17 +2,10 @@
 
 import pytest
 from uuid import UUID, uuid4
-from src.core.auth import AuthService
 from src.core.database import get_cursor
 from src.core.db_storage import DatabaseStorage
 
 
-@pytest.fixture
-def auth_service():
-    """Create AuthService instance."""
-    return AuthService()
-
-
 @pytest.fixture
 def test_user(auth_service):
     """Create a test user."""
@@ -34,21 +27,17 @@ def test_user_with_cards(auth_service):
     password = "testpassword123"
     user = auth_service.register(email, password)
     
-    # Add some cards directly via database
+    # Add some cards directly via database, in a single multi-row INSERT
     with get_cursor() as cursor:
         cursor.execute(
             """
             INSERT INTO cards (user_id, name, issuer, annual_fee, opened_date)
-            VALUES (%s, %s, %s, %s, %s)
+            VALUES (%s, %s, %s, %s, %s), (%s, %s, %s, %s, %s)
             """,
-            (str(user.id), "Test Card 1", "Test Bank", 95, "2024-01-01")
-        )
-        cursor.execute(
-            """
-            INSERT INTO cards (user_id, name, issuer, annual_fee, opened_date)
-            VALUES (%s, %s, %s, %s, %s)
-            """,
-            (str(user.id), "Test Card 2", "Test Bank", 0, "2024-01-01")
+            (
+                str(user.id), "Test Card 1", "Test Bank", 95, "2024-01-01",
+                str(user.id), "Test Card 2", "Test Bank", 0, "2024-01-01",
+            )
         )
     
     yield user
@@ -136,25 +125,17 @@ class TestAccountDeletion:
         result = auth_service.delete_account(user_id)
         assert result is True
         
-        # Verify all related data is gone
+        # Verify all related data is gone (cards, user_preferences and
+        # sessions) in one round-trip
         with get_cursor(commit=False) as cursor:
-            # Check cards
             cursor.execute(
-                "SELECT COUNT(*) FROM cards WHERE user_id = %s",
-                (str(user_id),)
-            )
-            assert cursor.fetchone()["count"] == 0
-            
-            # Check user_preferences (may not exist, that's ok)
-            cursor.execute(
-                "SELECT COUNT(*) FROM user_preferences WHERE user_id = %s",
-                (str(user_id),)
-            )
-            assert cursor.fetchone()["count"] == 0
-            
-            # Check sessions
-            cursor.execute(
-                "SELECT COUNT(*) FROM sessions WHERE user_id = %s",
-                (str(user_id),)
+                """
+                SELECT
+                    (SELECT COUNT(*) FROM cards WHERE user_id = %(user_id)s) AS cards,
+                    (SELECT COUNT(*) FROM user_preferences WHERE user_id = %(user_id)s) AS user_preferences,
+                    (SELECT COUNT(*) FROM sessions WHERE user_id = %(user_id)s) AS sessions
+                """,
+                {"user_id": str(user_id)}
             )
-            assert cursor.fetchone()["count"] == 0
+            counts = cursor.fetchone()
+            assert counts == {"cards": 0, "user_preferences": 0, "sessions": 0}
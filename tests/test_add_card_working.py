@@ -67,7 +67,7 @@ def run_test():
         options.add_argument("--disable-dev-shm-usage")
         options.add_argument("--window-size=1920,1080")
 
-        service = Service(ChromeDriverManager().install())
+        service = Service(os.environ.get("CHROMEDRIVER_PATH") or ChromeDriverManager().install())
         browser = webdriver.Chrome(service=service, options=options)
         wait = WebDriverWait(browser, 10)
 
@@ -85,12 +85,10 @@ def run_test():
 
         # Click Add Card tab
         print("\n[2] Clicking Add Card tab...")
-        tabs = browser.find_elements(By.CSS_SELECTOR, "[data-baseweb='tab']")
-        for tab in tabs:
-            if "Add" in tab.text:
-                tab.click()
-                print(f"   Clicked: {tab.text}")
-                break
+        tabs = browser.find_elements(By.XPATH, "//*[@data-baseweb='tab'][contains(., 'Add')]")
+        if tabs:
+            tabs[0].click()
+            print(f"   Clicked: {tabs[0].text}")
         time.sleep(3)
 
         # Find and click the Card selectbox
@@ -0,0 +1,49 @@
+"""Tests for AI extraction rate-limit bookkeeping."""
+
+from unittest.mock import MagicMock, patch
+from uuid import UUID
+
+from src.core.ai_rate_limit import (
+    get_current_day_key,
+    get_current_month_key,
+    record_extractions_bulk,
+)
+
+
+USER_ID = UUID("00000000-0000-0000-0000-000000000001")
+
+
+class TestRecordExtractionsBulk:
+    """Test batched extraction recording."""
+
+    def test_counter_and_logs_in_two_statements(self):
+        """Should bump the counter by the batch size and log one row per extraction."""
+        cursor = MagicMock()
+
+        with patch("src.core.ai_rate_limit.get_cursor") as mock_get_cursor:
+            mock_get_cursor.return_value.__enter__.return_value = cursor
+            ids = record_extractions_bulk(USER_ID, 3, model="gemini-2.5-flash", extraction_type="xlsx")
+
+        assert len(ids) == 3
+        assert len(set(ids)) == 3
+        assert cursor.execute.call_count == 2
+
+        counter_sql, counter_params = cursor.execute.call_args_list[0].args
+        assert "INSERT INTO ai_extractions" in counter_sql
+        assert "ai_extractions.extraction_count + EXCLUDED.extraction_count" in counter_sql
+        assert counter_params == (str(USER_ID), get_current_month_key(), get_current_day_key(), 3)
+
+        log_sql, log_params = cursor.execute.call_args_list[1].args
+        assert "INSERT INTO ai_extraction_logs" in log_sql
+        assert "unnest(%s::text[])" in log_sql
+        assert log_params == (
+            str(USER_ID), get_current_month_key(), get_current_day_key(),
+            "gemini-2.5-flash", "xlsx", True, ids,
+        )
+
+    def test_empty_batch_skips_database(self):
+        """Should not open a cursor when there is nothing to record."""
+        with patch("src.core.ai_rate_limit.get_cursor") as mock_get_cursor:
+            assert record_extractions_bulk(USER_ID, 0) == []
+
+        mock_get_cursor.assert_not_called()
@@ -1,39 +1,72 @@
 """Tests for authentication service."""
 
 import pytest
-from unittest.mock import patch, MagicMock
-from uuid import UUID
+import threading
+from datetime import datetime, timedelta
+
+from src.core import auth, rate_limit
+from src.core.auth import (
+    hash_password,
+    verify_password,
+    validate_email,
+    validate_password,
+    get_bcrypt_rounds,
+)
+from src.core.rate_limit import (
+    check_login_rate_limit,
+    record_login_failure,
+    reset_login_attempts,
+    check_signup_rate_limit,
+    record_signup_attempt,
+    check_feedback_rate_limit,
+    record_feedback_submission,
+)
+
+
+@pytest.fixture(scope="class")
+def hashed_password():
+    """One bcrypt hash of "mysecretpassword" shared by the hashing tests.
+
+    bcrypt is deliberately slow, so the hash is computed once per class.
+    """
+    return hash_password("mysecretpassword")
 
 
 class TestPasswordHashing:
     """Test password hashing functions."""
 
-    def test_hash_password_returns_string(self):
+    def test_hash_password_returns_string(self, hashed_password):
         """Should hash password and return string."""
-        from src.core.auth import hash_password
+        assert isinstance(hashed_password, str)
+        assert hashed_password != "mysecretpassword"
+        assert len(hashed_password) > 20
 
-        hashed = hash_password("mysecretpassword")
-
-        assert isinstance(hashed, str)
-        assert hashed != "mysecretpassword"
-        assert len(hashed) > 20
-
-    def test_verify_password_correct(self):
+    def test_verify_password_correct(self, hashed_password):
         """Should verify correct password."""
-        from src.core.auth import hash_password, verify_password
+        assert verify_password("mysecretpassword", hashed_password) is True
 
-        password = "mysecretpassword"
-        hashed = hash_password(password)
+    def test_verify_password_incorrect(self, hashed_password):
+        """Should reject incorrect password."""
+        assert verify_password("wrongpassword", hashed_password) is False
 
-        assert verify_password(password, hashed) is True
+    def test_bcrypt_rounds_from_env(self, monkeypatch):
+        """Should read the work factor from BCRYPT_ROUNDS."""
+        monkeypatch.setenv("BCRYPT_ROUNDS", "5")
+        assert get_bcrypt_rounds() == 5
 
-    def test_verify_password_incorrect(self):
-        """Should reject incorrect password."""
-        from src.core.auth import hash_password, verify_password
+    @pytest.mark.parametrize("value,expected", [("2", 4), ("40", 31), ("fast", 12)])
+    def test_bcrypt_rounds_clamped_or_defaulted(self, monkeypatch, value, expected):
+        """Should clamp out-of-range values and ignore invalid ones."""
+        monkeypatch.setenv("BCRYPT_ROUNDS", value)
+        assert get_bcrypt_rounds() == expected
 
-        hashed = hash_password("correctpassword")
+    def test_bcrypt_rounds_below_minimum_raised(self, monkeypatch, caplog):
+        """Should not go below the production minimum of 10 rounds."""
+        monkeypatch.setattr(auth, "MIN_BCRYPT_ROUNDS", 10)
+        monkeypatch.setenv("BCRYPT_ROUNDS", "4")
 
-        assert verify_password("wrongpassword", hashed) is False
+        assert get_bcrypt_rounds() == 10
+        assert "BCRYPT_ROUNDS=4" in caplog.text
 
 
 class TestEmailValidation:
@@ -41,35 +74,33 @@ class TestEmailValidation:
 
     def test_valid_email(self):
         """Should accept valid email."""
-        from src.core.auth import validate_email
-
         assert validate_email("user@example.com") is True
         assert validate_email("user.name@domain.co.uk") is True
 
     def test_invalid_email(self):
         """Should reject invalid email."""
-        from src.core.auth import validate_email
-
         assert validate_email("not-an-email") is False
         assert validate_email("@example.com") is False
         assert validate_email("user@") is False
         assert validate_email("") is False
 
+    def test_invalid_long_email_fails_fast(self):
+        """Should reject long malformed input without regex backtracking blowup."""
+        assert validate_email("a" * 10000 + "@") is False
+        assert validate_email("a@" + "a." * 5000 + "!") is False
+        assert validate_email("a@a." + "ab" * 5000 + "1") is False
+
 
 class TestPasswordValidation:
     """Test password validation."""
 
     def test_valid_password(self):
         """Should accept password >= 8 chars."""
-        from src.core.auth import validate_password
-
         assert validate_password("12345678") is True
         assert validate_password("longpassword123") is True
 
     def test_invalid_password(self):
         """Should reject password < 8 chars."""
-        from src.core.auth import validate_password
-
         assert validate_password("1234567") is False
         assert validate_password("short") is False
         assert validate_password("") is False
@@ -80,15 +111,12 @@ class TestRateLimiting:
 
     def setup_method(self):
         """Clear rate limit storage before each test."""
-        from src.core import rate_limit
         rate_limit._login_attempts.clear()
         rate_limit._signup_attempts.clear()
         rate_limit._feedback_attempts.clear()
 
     def test_login_rate_limit_allows_under_limit(self):
         """Should allow login attempts under the limit."""
-        from src.core.rate_limit import check_login_rate_limit, record_login_failure
-
         email = "test@example.com"
 
         # First 4 attempts should be allowed
@@ -100,8 +128,6 @@ class TestRateLimiting:
 
     def test_login_rate_limit_blocks_after_max_attempts(self):
         """Should block login after 5 failed attempts."""
-        from src.core.rate_limit import check_login_rate_limit, record_login_failure
-
         email = "test@example.com"
 
         # Fail 5 times
@@ -117,12 +143,6 @@ class TestRateLimiting:
 
     def test_login_rate_limit_reset_on_success(self):
         """Should reset rate limit on successful login."""
-        from src.core.rate_limit import (
-            check_login_rate_limit,
-            record_login_failure,
-            reset_login_attempts,
-        )
-
         email = "test@example.com"
 
         # Fail 3 times
@@ -139,8 +159,6 @@ class TestRateLimiting:
 
     def test_signup_rate_limit_allows_under_limit(self):
         """Should allow signup attempts under the limit."""
-        from src.core.rate_limit import check_signup_rate_limit, record_signup_attempt
-
         session_id = "test_session_123"
 
         # First 2 attempts should be allowed
@@ -152,8 +170,6 @@ class TestRateLimiting:
 
     def test_signup_rate_limit_blocks_after_max_attempts(self):
         """Should block signup after 3 attempts."""
-        from src.core.rate_limit import check_signup_rate_limit, record_signup_attempt
-
         session_id = "test_session_123"
 
         # Attempt 3 times
@@ -169,11 +185,6 @@ class TestRateLimiting:
 
     def test_feedback_rate_limit_allows_under_limit(self):
         """Should allow feedback submissions under the limit."""
-        from src.core.rate_limit import (
-            check_feedback_rate_limit,
-            record_feedback_submission,
-        )
-
         user_id = "test_user_123"
 
         # First 4 submissions should be allowed
@@ -185,11 +196,6 @@ class TestRateLimiting:
 
     def test_feedback_rate_limit_blocks_after_max_attempts(self):
         """Should block feedback after 5 submissions."""
-        from src.core.rate_limit import (
-            check_feedback_rate_limit,
-            record_feedback_submission,
-        )
-
         user_id = "test_user_123"
 
         # Submit 5 times
@@ -204,10 +210,6 @@ class TestRateLimiting:
 
     def test_rate_limit_lockout_expires(self):
         """Should allow login after lockout period expires."""
-        from src.core.rate_limit import check_login_rate_limit, record_login_failure
-        from datetime import datetime, timedelta
-        from src.core import rate_limit
-
         email = "test@example.com"
 
         # Trigger lockout
@@ -221,8 +223,67 @@ class TestRateLimiting:
 
         # Manually expire the lockout (simulate time passing)
         record = rate_limit._login_attempts[email]
-        record["locked_until"] = datetime.utcnow() - timedelta(minutes=1)
+        record.locked_until = datetime.utcnow() - timedelta(minutes=1)
 
         # Should now be allowed
         allowed, msg = check_login_rate_limit(email)
         assert allowed is True
+
+    def test_stale_records_are_evicted(self):
+        """Should drop records that have not been updated within their TTL."""
+        record_login_failure("stale@example.com")
+        rate_limit._login_attempts["stale@example.com"].last_update = (
+            datetime.utcnow() - rate_limit.LOGIN_RECORD_TTL - timedelta(seconds=1)
+        )
+
+        check_login_rate_limit("fresh@example.com")
+
+        assert "stale@example.com" not in rate_limit._login_attempts
+        assert "fresh@example.com" in rate_limit._login_attempts
+
+    def test_record_count_is_capped(self, monkeypatch):
+        """Should drop the least recently updated record past the size cap."""
+        monkeypatch.setattr(rate_limit, "MAX_RECORDS_PER_STORE", 2)
+
+        for session_id in ["first", "second", "third"]:
+            check_signup_rate_limit(session_id)
+            assert len(rate_limit._signup_attempts) <= 2
+            record_signup_attempt(session_id)
+
+        assert list(rate_limit._signup_attempts) == ["second", "third"]
+
+    def test_size_cap_keeps_active_lockouts(self, monkeypatch):
+        """Should not drop a locked-out record to make room for new ones."""
+        monkeypatch.setattr(rate_limit, "MAX_RECORDS_PER_STORE", 2)
+        email = "locked@example.com"
+        for i in range(6):
+            check_login_rate_limit(email)
+            record_login_failure(email)
+
+        for other in ["a@example.com", "b@example.com", "c@example.com"]:
+            record_login_failure(other)
+
+        assert email in rate_limit._login_attempts
+        allowed, msg = check_login_rate_limit(email)
+        assert allowed is False
+
+    def test_concurrent_failures_with_eviction(self, monkeypatch):
+        """Should not raise when threads update and evict the same store."""
+        monkeypatch.setattr(rate_limit, "MAX_RECORDS_PER_STORE", 4)
+        errors = []
+
+        def fail_logins(worker):
+            try:
+                for i in range(200):
+                    record_login_failure(f"user{worker}-{i % 10}@example.com")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=fail_logins, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(rate_limit._login_attempts) <= 4
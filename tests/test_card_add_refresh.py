@@ -15,17 +15,10 @@ from datetime import date, timedelta
 from uuid import UUID, uuid4
 
 from src.core.db_storage import DatabaseStorage
-from src.core.auth import AuthService
 from src.core.library import get_all_templates, get_template
 from src.core.models import SignupBonus
 
 
-@pytest.fixture
-def auth_service():
-    """Create AuthService instance."""
-    return AuthService()
-
-
 @pytest.fixture
 def test_user(auth_service):
     """Create a test user."""
@@ -27,6 +27,18 @@ class TestDatabaseStorageInterface:
 
         assert hasattr(DatabaseStorage, "delete_card")
 
+    def test_has_delete_cards_method(self):
+        """Should have delete_cards method for bulk deletes."""
+        from src.core.db_storage import DatabaseStorage
+
+        assert hasattr(DatabaseStorage, "delete_cards")
+
+    def test_has_has_cards_method(self):
+        """Should have has_cards method for cheap existence checks."""
+        from src.core.db_storage import DatabaseStorage
+
+        assert hasattr(DatabaseStorage, "has_cards")
+
     def test_has_get_preferences_method(self):
         """Should have get_preferences method."""
         from src.core.db_storage import DatabaseStorage
@@ -38,3 +50,58 @@ class TestDatabaseStorageInterface:
         from src.core.db_storage import DatabaseStorage
 
         assert hasattr(DatabaseStorage, "save_preferences")
+
+
+class TestDeleteCards:
+    """Test bulk card deletion."""
+
+    def test_delete_cards_issues_single_statement(self):
+        """Should delete all ids with one scoped DELETE."""
+        from src.core.db_storage import DatabaseStorage
+
+        user_id = UUID("00000000-0000-0000-0000-000000000001")
+        storage = DatabaseStorage(user_id)
+        cursor = MagicMock()
+        cursor.rowcount = 2
+
+        with patch("src.core.db_storage.get_cursor") as mock_get_cursor:
+            mock_get_cursor.return_value.__enter__.return_value = cursor
+            deleted = storage.delete_cards(["card-a", "card-b"])
+
+        assert deleted == 2
+        cursor.execute.assert_called_once()
+        sql, params = cursor.execute.call_args[0]
+        assert "DELETE FROM cards" in sql
+        assert "user_id = %s" in sql
+        assert params == (["card-a", "card-b"], str(user_id))
+
+    def test_delete_cards_empty_skips_database(self):
+        """Should not touch the database when no ids are given."""
+        from src.core.db_storage import DatabaseStorage
+
+        storage = DatabaseStorage(UUID("00000000-0000-0000-0000-000000000001"))
+
+        with patch("src.core.db_storage.get_cursor") as mock_get_cursor:
+            assert storage.delete_cards([]) == 0
+
+        mock_get_cursor.assert_not_called()
+
+
+class TestHasCards:
+    """Test card existence check."""
+
+    @pytest.mark.parametrize("row,expected", [((1,), True), (None, False)])
+    def test_has_cards_uses_bounded_query(self, row, expected):
+        """Should stop at the first matching row."""
+        from src.core.db_storage import DatabaseStorage
+
+        storage = DatabaseStorage(UUID("00000000-0000-0000-0000-000000000001"))
+        cursor = MagicMock()
+        cursor.fetchone.return_value = row
+
+        with patch("src.core.db_storage.get_cursor") as mock_get_cursor:
+            mock_get_cursor.return_value.__enter__.return_value = cursor
+            assert storage.has_cards() is expected
+
+        sql = cursor.execute.call_args[0][0]
+        assert "LIMIT 1" in sql
@@ -81,7 +81,7 @@ def create_browser():
     # Enable logging
     options.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
 
-    service = Service(ChromeDriverManager().install())
+    service = Service(os.environ.get("CHROMEDRIVER_PATH") or ChromeDriverManager().install())
     driver = webdriver.Chrome(service=service, options=options)
 
     return driver
@@ -89,13 +89,13 @@ def create_browser():
 
 def get_localstorage(browser, key='churnpilot_cards'):
     """Get value from localStorage."""
-    result = browser.execute_script(f"return localStorage.getItem('{key}')")
+    result = browser.execute_script("return localStorage.getItem(arguments[0])", key)
     return result
 
 
 def set_localstorage(browser, key, value):
     """Set value in localStorage."""
-    browser.execute_script(f"localStorage.setItem('{key}', '{value}')")
+    browser.execute_script("localStorage.setItem(arguments[0], arguments[1])", key, value)
 
 
 def clear_localstorage(browser):
@@ -282,15 +282,11 @@ def run_test():
         from selenium.webdriver.common.by import By
 
         try:
-            tabs = browser.find_elements(By.CSS_SELECTOR, "[data-baseweb='tab']")
-            add_tab = None
-            for tab in tabs:
-                if "Add" in tab.text:
-                    add_tab = tab
-                    break
-
-            if add_tab:
-                add_tab.click()
+            tabs = browser.find_elements(
+                By.XPATH, "//*[@data-baseweb='tab'][contains(., 'Add')]"
+            )
+            if tabs:
+                tabs[0].click()
                 time.sleep(2)
                 print("   Clicked Add Card tab")
             else:
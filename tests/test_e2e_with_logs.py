@@ -68,7 +68,7 @@ def run_test():
         options.add_argument("--disable-dev-shm-usage")
         options.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
 
-        service = Service(ChromeDriverManager().install())
+        service = Service(os.environ.get("CHROMEDRIVER_PATH") or ChromeDriverManager().install())
         browser = webdriver.Chrome(service=service, options=options)
 
         url = "http://localhost:8599"
@@ -89,7 +89,7 @@ def run_test():
             "created_at": "2024-01-01T00:00:00"
         }
         browser.execute_script(
-            f"localStorage.setItem('churnpilot_cards', '{json.dumps([test_card])}')"
+            "localStorage.setItem(arguments[0], arguments[1])", "churnpilot_cards", json.dumps([test_card])
         )
 
         verify = browser.execute_script("return localStorage.getItem('churnpilot_cards')")
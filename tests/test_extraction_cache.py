@@ -0,0 +1,112 @@
+"""Tests for the on-disk fetch/extraction cache."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from src.core.extraction_cache import (
+    make_cache_key,
+    get_cached,
+    set_cached,
+    evict,
+    is_cache_enabled,
+)
+from src.core.models import CardData
+from src.core.pipeline import extract_from_url
+
+
+URL = "https://www.uscreditcardguide.com/amex-platinum/"
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Enable the cache in a temporary directory."""
+    monkeypatch.setenv("CHURN_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("CHURN_NO_CACHE", raising=False)
+    return tmp_path
+
+
+class TestCacheStore:
+    """Test key building and get/set/evict."""
+
+    def test_key_fields_are_length_prefixed(self):
+        """Moving characters between fields should change the key."""
+        assert make_cache_key("ab", "c") != make_cache_key("a", "bc")
+        assert make_cache_key("ab", "c") == make_cache_key("ab", "c")
+
+    def test_round_trip(self, cache_dir):
+        """Stored values should come back unchanged."""
+        key = make_cache_key("fetch", URL)
+        set_cached(key, "# Platinum\n\nContent")
+
+        assert get_cached(key) == "# Platinum\n\nContent"
+        assert (cache_dir / f"{key}.json").exists()
+
+    def test_concurrent_writes_leave_one_entry(self, cache_dir):
+        """Threads writing the same key should not clash on a temp file."""
+        key = make_cache_key("fetch", URL)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: set_cached(key, f"content {i}"), range(32)))
+
+        assert get_cached(key).startswith("content ")
+        assert [p.name for p in cache_dir.iterdir()] == [f"{key}.json"]
+
+    def test_evict_removes_entry(self, cache_dir):
+        """Evicted entries should miss."""
+        key = make_cache_key("fetch", URL)
+        set_cached(key, "content")
+        evict(key)
+
+        assert get_cached(key) is None
+
+    def test_disabled_without_cache_dir(self, monkeypatch):
+        """Without CHURN_CACHE_DIR nothing is stored."""
+        monkeypatch.delenv("CHURN_CACHE_DIR", raising=False)
+        key = make_cache_key("fetch", URL)
+        set_cached(key, "content")
+
+        assert not is_cache_enabled()
+        assert get_cached(key) is None
+
+    def test_no_cache_env_bypasses_cache(self, cache_dir, monkeypatch):
+        """CHURN_NO_CACHE should turn the cache off even with a directory set."""
+        key = make_cache_key("fetch", URL)
+        set_cached(key, "content")
+        monkeypatch.setenv("CHURN_NO_CACHE", "1")
+
+        assert not is_cache_enabled()
+        assert get_cached(key) is None
+
+
+class TestPipelineCache:
+    """Test extract_from_url reuses cached extractions."""
+
+    def test_second_extraction_skips_ai(self, cache_dir):
+        """A repeat extraction of the same page should not call the AI."""
+        card = CardData(name="The Platinum Card", issuer="American Express", annual_fee=695)
+
+        with patch("src.core.pipeline.fetch_card_page", return_value="page content"), \
+                patch("src.core.pipeline._extract_with_ai",
+                      return_value=(card, "gemini-2.5-flash", 12)) as mock_ai:
+            first = extract_from_url(URL)
+            second = extract_from_url(URL)
+
+        mock_ai.assert_called_once()
+        assert second.name == first.name
+        assert second.annual_fee == 695
+
+    def test_invalid_entry_is_evicted(self, cache_dir):
+        """An entry that no longer validates should be replaced by a fresh extraction."""
+        card = CardData(name="The Platinum Card", issuer="American Express", annual_fee=695)
+
+        with patch("src.core.pipeline.fetch_card_page", return_value="page content"), \
+                patch("src.core.pipeline._extract_with_ai",
+                      return_value=(card, "gemini-2.5-flash", 12)) as mock_ai:
+            extract_from_url(URL)
+            for entry in cache_dir.glob("*.json"):
+                entry.write_text('{"value": "{\\"annual_fee\\": \\"unknown\\"}"}')
+            result = extract_from_url(URL)
+
+        assert mock_ai.call_count == 2
+        assert result.annual_fee == 695
@@ -71,7 +71,7 @@ def run_test():
         options.add_argument("--disable-dev-shm-usage")
         options.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
 
-        service = Service(ChromeDriverManager().install())
+        service = Service(os.environ.get("CHROMEDRIVER_PATH") or ChromeDriverManager().install())
         browser = webdriver.Chrome(service=service, options=options)
 
         url = "http://localhost:8599"
@@ -86,13 +86,11 @@ def run_test():
 
         # Step 2: Navigate to Add Card tab
         print("\n[Step 2] Navigate to Add Card tab...")
-        tabs = browser.find_elements(By.CSS_SELECTOR, "[data-baseweb='tab']")
-        for tab in tabs:
-            if "Add" in tab.text:
-                tab.click()
-                time.sleep(2)
-                print(f"   Clicked: {tab.text}")
-                break
+        tabs = browser.find_elements(By.XPATH, "//*[@data-baseweb='tab'][contains(., 'Add')]")
+        if tabs:
+            tabs[0].click()
+            time.sleep(2)
+            print(f"   Clicked: {tabs[0].text}")
 
         # Step 3: Select a card from the library
         print("\n[Step 3] Selecting a card from the library...")
@@ -161,12 +159,10 @@ def run_test():
         time.sleep(10)
 
         # Navigate back to Add Card
-        tabs = browser.find_elements(By.CSS_SELECTOR, "[data-baseweb='tab']")
-        for tab in tabs:
-            if "Add" in tab.text:
-                tab.click()
-                time.sleep(2)
-                break
+        tabs = browser.find_elements(By.XPATH, "//*[@data-baseweb='tab'][contains(., 'Add')]")
+        if tabs:
+            tabs[0].click()
+            time.sleep(2)
 
         # Select card
         selectboxes = browser.find_elements(By.CSS_SELECTOR, "[data-testid='stSelectbox']")
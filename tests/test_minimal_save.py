@@ -26,17 +26,20 @@ st.title("Minimal Save Test")
 data = get_local_storage("test_key", component_key="load")
 st.write(f"Loaded data: {data}")
 
+# Bump a nonce only when a save is requested, so each save gets a fresh
+# component key while unrelated reruns keep the same one
+st.session_state.setdefault("save_nonce", 0)
+
 if st.button("Save"):
-    # Use a unique key each time
-    import time
-    save_key = f"save_{time.time()}"
+    st.session_state.save_nonce += 1
+    save_key = f"save_{st.session_state.save_nonce}"
     set_local_storage("test_key", "hello_world", component_key=save_key)
     st.success(f"Save component created (key={save_key})")
     # DON'T rerun - let the page complete
 
 if st.button("Save and Rerun"):
-    import time
-    save_key = f"save_{time.time()}"
+    st.session_state.save_nonce += 1
+    save_key = f"save_{st.session_state.save_nonce}"
     set_local_storage("test_key", "hello_rerun", component_key=save_key)
     st.success("Save component created, will rerun...")
     st.rerun()
@@ -97,7 +100,7 @@ def run_test():
         options.add_argument("--disable-dev-shm-usage")
         options.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
 
-        service = Service(ChromeDriverManager().install())
+        service = Service(os.environ.get("CHROMEDRIVER_PATH") or ChromeDriverManager().install())
         browser = webdriver.Chrome(service=service, options=options)
 
         url = "http://localhost:8599"
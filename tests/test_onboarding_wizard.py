@@ -0,0 +1,53 @@
+"""Tests for saving onboarding wizard completion."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from src.ui.components import onboarding_wizard
+from src.ui.components.onboarding_wizard import (
+    MARK_ONBOARDING_COMPLETED_SQL,
+    mark_wizard_completed,
+)
+
+
+class TestMarkWizardCompleted:
+    """Test mark_wizard_completed's session and database writes."""
+
+    def test_saves_to_db_and_returns_true(self):
+        """Should write the flag for the user and report success."""
+        user_id = str(uuid4())
+        cursor = MagicMock()
+
+        with patch.object(onboarding_wizard.st, "session_state", SimpleNamespace()) as state, \
+                patch("src.ui.components.onboarding_wizard.get_cursor") as mock_get_cursor:
+            mock_get_cursor.return_value.__enter__.return_value = cursor
+            assert mark_wizard_completed(user_id) is True
+            assert state.wizard_completed is True
+
+        cursor.execute.assert_called_once_with(MARK_ONBOARDING_COMPLETED_SQL, (user_id,))
+
+    def test_db_failure_returns_false(self):
+        """Should report a failed write while still hiding the wizard this session."""
+        with patch.object(onboarding_wizard.st, "session_state", SimpleNamespace()) as state, \
+                patch("src.ui.components.onboarding_wizard.get_cursor",
+                      side_effect=Exception("connection refused")):
+            assert mark_wizard_completed(str(uuid4())) is False
+            assert state.wizard_completed is True
+
+    def test_invalid_user_id_returns_false(self):
+        """Should not touch the database for a malformed user ID."""
+        with patch.object(onboarding_wizard.st, "session_state", SimpleNamespace()), \
+                patch("src.ui.components.onboarding_wizard.get_cursor") as mock_get_cursor:
+            assert mark_wizard_completed("not-a-uuid") is False
+
+        mock_get_cursor.assert_not_called()
+
+    def test_without_user_only_sets_session(self):
+        """Should skip the database when no user is signed in."""
+        with patch.object(onboarding_wizard.st, "session_state", SimpleNamespace()) as state, \
+                patch("src.ui.components.onboarding_wizard.get_cursor") as mock_get_cursor:
+            assert mark_wizard_completed() is True
+            assert state.wizard_completed is True
+
+        mock_get_cursor.assert_not_called()
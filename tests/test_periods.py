@@ -8,11 +8,14 @@ from datetime import date
 
 from src.core.models import Credit, CreditUsage
 from src.core.periods import (
+    FREQUENCY_MULTIPLIERS,
     get_current_period,
     get_period_display_name,
     is_credit_used_this_period,
+    is_credit_used_in_period,
     is_reminder_snoozed,
     get_unused_credits_count,
+    get_credits_stats,
     mark_credit_used,
     mark_credit_unused,
     snooze_credit_reminder,
@@ -60,6 +63,22 @@ class TestGetCurrentPeriod:
         assert get_current_period("unknown", date(2024, 6, 15)) == "2024"
 
 
+class TestFrequencyMultipliers:
+    """Tests for the FREQUENCY_MULTIPLIERS lookup table."""
+
+    def test_known_frequencies(self):
+        """Test resets-per-year for each recurring frequency."""
+        assert FREQUENCY_MULTIPLIERS["monthly"] == 12
+        assert FREQUENCY_MULTIPLIERS["quarterly"] == 4
+        assert FREQUENCY_MULTIPLIERS["semi-annual"] == 2
+        assert FREQUENCY_MULTIPLIERS["semi-annually"] == 2
+
+    def test_annual_and_unknown_default_to_one(self):
+        """Test that annual and unknown frequencies count once per year."""
+        assert FREQUENCY_MULTIPLIERS.get("annual", 1) == 1
+        assert FREQUENCY_MULTIPLIERS.get("every 4 years", 1) == 1
+
+
 class TestGetPeriodDisplayName:
     """Tests for get_period_display_name function."""
 
@@ -117,6 +136,28 @@ class TestIsCreditUsedThisPeriod:
         assert is_credit_used_this_period("Saks Credit", "quarterly", credit_usage, date(2024, 4, 1)) is False
 
 
+class TestIsCreditUsedInPeriod:
+    """Tests for is_credit_used_in_period function."""
+
+    def test_matches_precomputed_period(self):
+        """Test that a precomputed period gives the same answer."""
+        usage = {"Uber": CreditUsage(last_used_period="2024-01")}
+        ref = date(2024, 1, 20)
+        period = get_current_period("monthly", ref)
+
+        assert is_credit_used_in_period("Uber", period, usage) is True
+        assert is_credit_used_in_period("Uber", period, usage) == is_credit_used_this_period(
+            "Uber", "monthly", usage, ref
+        )
+
+    def test_other_period_or_missing_credit(self):
+        """Test unused results for a stale period or unknown credit."""
+        usage = {"Uber": CreditUsage(last_used_period="2023-12")}
+
+        assert is_credit_used_in_period("Uber", "2024-01", usage) is False
+        assert is_credit_used_in_period("Saks", "2024-H1", usage) is False
+
+
 class TestIsReminderSnoozed:
     """Tests for is_reminder_snoozed function."""
 
@@ -200,6 +241,30 @@ class TestGetUnusedCreditsCount:
         assert count == 3
 
 
+class TestGetCreditsStats:
+    """Tests for get_credits_stats function."""
+
+    def test_counts_total_and_unused(self):
+        """Test both counts come back from one call."""
+        credits = [
+            Credit(name="Uber Credit", amount=15.0, frequency="monthly"),
+            Credit(name="Saks Credit", amount=50.0, frequency="semi-annually"),
+            Credit(name="Airline Credit", amount=200.0, frequency="annual"),
+        ]
+        credit_usage = {
+            "Uber Credit": CreditUsage(last_used_period="2024-01"),
+            "Saks Credit": CreditUsage(reminder_snoozed_until=date(2024, 2, 1)),
+        }
+        ref = date(2024, 1, 15)
+
+        assert get_credits_stats(credits, credit_usage, ref) == (3, 1)
+        assert get_credits_stats(credits, credit_usage, ref, include_snoozed=True) == (3, 2)
+
+    def test_empty(self):
+        """Test no credits."""
+        assert get_credits_stats([], {}) == (0, 0)
+
+
 class TestMarkCreditUsed:
     """Tests for mark_credit_used function."""
 
@@ -0,0 +1,97 @@
+"""Tests for the extraction pipeline entry points."""
+
+import threading
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from src.core.exceptions import ExtractionError, FetchError
+from src.core.models import CardData
+from src.core.pipeline import extract_from_urls
+
+
+URLS = [
+    "https://www.uscreditcardguide.com/amex-platinum/",
+    "https://www.uscreditcardguide.com/chase-sapphire-preferred/",
+    "https://www.uscreditcardguide.com/citi-premier/",
+]
+
+
+class TestExtractFromUrls:
+    """Test concurrent multi-URL extraction."""
+
+    def test_results_keep_url_order(self):
+        """Should return one CardData per URL, in input order."""
+        def fake_extract(url, timeout, user_id=None):
+            return CardData(name=url, issuer="Test", annual_fee=0)
+
+        with patch("src.core.pipeline.extract_from_url", side_effect=fake_extract):
+            results = extract_from_urls(URLS)
+
+        assert [card.name for card in results] == URLS
+
+    def test_extractions_run_concurrently(self):
+        """Should have all extractions in flight at the same time."""
+        barrier = threading.Barrier(len(URLS), timeout=5)
+
+        def fake_extract(url, timeout, user_id=None):
+            barrier.wait()  # Only passes if every URL is being extracted at once
+            return CardData(name=url, issuer="Test", annual_fee=0)
+
+        with patch("src.core.pipeline.extract_from_url", side_effect=fake_extract):
+            results = extract_from_urls(URLS)
+
+        assert len(results) == len(URLS)
+
+    def test_empty_list(self):
+        """Should return an empty list without starting workers."""
+        assert extract_from_urls([]) == []
+
+    def test_errors_propagate(self):
+        """Should raise the first failing URL's error."""
+        with patch("src.core.pipeline.extract_from_url", side_effect=FetchError("blocked")):
+            with pytest.raises(FetchError):
+                extract_from_urls(URLS)
+
+    def test_failure_stops_remaining_extractions(self):
+        """Should not start further extractions once one URL has failed."""
+        urls = URLS + ["https://www.uscreditcardguide.com/amex-gold/"]
+        later_started = threading.Event()
+        calls = []
+
+        def fake_extract(url, timeout, user_id=None):
+            calls.append(url)
+            if url == urls[0]:
+                # Still running when the second URL fails
+                later_started.wait(timeout=0.5)
+                return CardData(name=url, issuer="Test", annual_fee=0)
+            if url == urls[1]:
+                raise FetchError("blocked")
+            later_started.set()
+            return CardData(name=url, issuer="Test", annual_fee=0)
+
+        with patch("src.core.pipeline.extract_from_url", side_effect=fake_extract):
+            with pytest.raises(FetchError):
+                extract_from_urls(urls, max_workers=2)
+
+        assert sorted(calls) == sorted(urls[:2])
+
+    def test_batch_over_limit_is_rejected_up_front(self):
+        """Should refuse the batch before extracting when it exceeds the user's limit."""
+        with patch("src.core.pipeline.check_extraction_limit", return_value=(True, 2, "")), \
+                patch("src.core.pipeline.extract_from_url") as mock_extract:
+            with pytest.raises(ExtractionError, match="2 AI extractions left"):
+                extract_from_urls(URLS, user_id=uuid4())
+
+        mock_extract.assert_not_called()
+
+    def test_user_id_passed_to_each_extraction(self):
+        """Should rate limit every extraction in the batch for the user."""
+        user_id = uuid4()
+        with patch("src.core.pipeline.check_extraction_limit", return_value=(True, 10, "")), \
+                patch("src.core.pipeline.extract_from_url",
+                      return_value=CardData(name="Card", issuer="Test", annual_fee=0)) as mock_extract:
+            extract_from_urls(URLS, user_id=user_id)
+
+        assert all(call.args[2] == user_id for call in mock_extract.call_args_list)
@@ -0,0 +1,116 @@
+"""Tests for text preprocessing before AI extraction."""
+
+from pathlib import Path
+
+from src.core.preprocessor import filter_markdown_sections
+
+# Saved copy of a card review page, as Jina Reader returns it
+AMEX_PLATINUM_PAGE = (Path(__file__).parent / "fixtures" / "amex_platinum_page.md").read_text(
+    encoding="utf-8"
+)
+
+
+PAGE = """# The Platinum Card from American Express
+
+American Express premium travel card.
+
+## Annual Fee
+
+$695 per year.
+
+## Credits
+
+### Uber Cash
+
+$15 per month.
+
+### Airline Fee Credit
+
+$200 per year.
+
+## How We Rate Cards
+
+Methodology text.
+
+## Comments
+
+Reader comments.
+"""
+
+
+class TestFilterMarkdownSections:
+    """Test section filtering of fetched Markdown."""
+
+    def test_keeps_relevant_sections_and_subsections(self):
+        """Should keep fee/credit sections, including their subsections."""
+        result = filter_markdown_sections(PAGE)
+
+        assert "$695 per year." in result
+        assert "### Uber Cash" in result
+        assert "$200 per year." in result
+
+    def test_drops_unrelated_sections(self):
+        """Should drop sections whose header is unrelated to the card terms."""
+        result = filter_markdown_sections(PAGE)
+
+        assert "Methodology text." not in result
+        assert "Reader comments." not in result
+        assert len(result) < len(PAGE)
+
+    def test_keeps_title_and_intro(self):
+        """Should always keep the page title and the intro text."""
+        result = filter_markdown_sections(PAGE)
+
+        assert result.startswith("# The Platinum Card from American Express")
+        assert "American Express premium travel card." in result
+
+    def test_unmatched_content_returned_unchanged(self):
+        """Should not filter pages without headers or matching sections."""
+        no_headers = "Plain text about a card with a $95 annual fee."
+        no_matches = "# Card\n\n## About Us\n\nCompany history."
+
+        assert filter_markdown_sections(no_headers) == no_headers
+        assert filter_markdown_sections(no_matches) == no_matches
+
+    def test_matches_whole_words_only(self):
+        """Should not keep sections whose header only contains a keyword."""
+        page = (
+            "# Card\n\nIntro.\n\n## Annual Fee\n\n$95.\n\n"
+            "## Learn More\n\nLinks.\n\n## Feedback\n\nSurvey.\n\n"
+            "## Book an Appointment\n\nBranches.\n"
+        )
+
+        result = filter_markdown_sections(page)
+
+        assert "$95." in result
+        assert "Links." not in result
+        assert "Survey." not in result
+        assert "Branches." not in result
+
+    def test_falls_back_when_fee_is_filtered_out(self):
+        """Should return the whole page if the annual fee sits in a dropped section."""
+        page = (
+            "# Card\n\nIntro.\n\n## Statement Credits\n\n$200 airline credit.\n\n"
+            "## Card Details\n\nThe annual fee is $695.\n"
+        )
+
+        assert filter_markdown_sections(page) == page
+
+    def test_falls_back_when_bonus_is_filtered_out(self):
+        """Should return the whole page if the bonus sits in a dropped section."""
+        page = (
+            "# Card\n\nIntro.\n\n## Annual Fee\n\n$95.\n\n"
+            "## Overview\n\nEarn a 60,000 point bonus after $4,000 in spend.\n"
+        )
+
+        assert filter_markdown_sections(page) == page
+
+    def test_review_page_trimmed_to_card_terms(self):
+        """Should cut a saved review page to under half while keeping the card terms."""
+        result = filter_markdown_sections(AMEX_PLATINUM_PAGE)
+
+        assert len(result) < 0.5 * len(AMEX_PLATINUM_PAGE)
+        assert "The annual fee is $695" in result
+        assert "Earn 80,000 Membership Rewards points" in result
+        assert "### Uber Cash" in result
+        assert "traveler88" not in result
@@ -66,7 +66,7 @@ def run_test():
         options.add_argument("--disable-dev-shm-usage")
         options.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
 
-        service = Service(ChromeDriverManager().install())
+        service = Service(os.environ.get("CHROMEDRIVER_PATH") or ChromeDriverManager().install())
         browser = webdriver.Chrome(service=service, options=options)
 
         url = "http://localhost:8599"
@@ -94,7 +94,7 @@ def run_test():
             "created_at": "2024-01-01T00:00:00"
         }
         browser.execute_script(
-            f"localStorage.setItem('churnpilot_cards', JSON.stringify([{json.dumps(card1)}]))"
+            "localStorage.setItem(arguments[0], arguments[1])", "churnpilot_cards", json.dumps([card1])
         )
         after_add1 = browser.execute_script("return localStorage.getItem('churnpilot_cards')")
         print(f"   After first card: {after_add1[:60] if after_add1 else 'None'}...")
@@ -123,7 +123,7 @@ def run_test():
         }
         cards.append(card2)
         browser.execute_script(
-            f"localStorage.setItem('churnpilot_cards', JSON.stringify({json.dumps(cards)}))"
+            "localStorage.setItem(arguments[0], arguments[1])", "churnpilot_cards", json.dumps(cards)
         )
         after_add2 = browser.execute_script("return localStorage.getItem('churnpilot_cards')")
         print(f"   After second card: {len(json.loads(after_add2))} cards")
@@ -155,13 +155,11 @@ def run_test():
 
         # Try to find and click the Add Card tab
         try:
-            tabs = browser.find_elements(By.CSS_SELECTOR, "[data-baseweb='tab']")
-            for tab in tabs:
-                if "Add" in tab.text:
-                    tab.click()
-                    time.sleep(2)
-                    print(f"   Clicked: {tab.text}")
-                    break
+            tabs = browser.find_elements(By.XPATH, "//*[@data-baseweb='tab'][contains(., 'Add')]")
+            if tabs:
+                tabs[0].click()
+                time.sleep(2)
+                print(f"   Clicked: {tabs[0].text}")
 
             # Look for the card library dropdown
             time.sleep(2)
@@ -15,19 +15,12 @@ from unittest.mock import patch, MagicMock
 from uuid import UUID, uuid4
 
 from src.core.auth import (
-    AuthService,
     SESSION_TOKEN_BYTES,
     SESSION_EXPIRY_HOURS,
 )
 from src.core.database import get_cursor
 
 
-@pytest.fixture
-def auth_service():
-    """Create AuthService instance."""
-    return AuthService()
-
-
 @pytest.fixture
 def test_user(auth_service):
     """Create a test user for session tests."""
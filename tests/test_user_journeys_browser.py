@@ -28,41 +28,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
-@pytest.fixture(scope="module")
-def streamlit_app():
-    """Use the already-running Streamlit app on localhost:8501."""
-    yield "http://localhost:8501"
-
-
-@pytest.fixture(scope="module")
-def browser():
-    """Create a Selenium browser instance using local chromedriver."""
-    from selenium import webdriver
-    from selenium.webdriver.chrome.service import Service
-    from selenium.webdriver.chrome.options import Options
-
-    options = Options()
-    options.add_argument("--headless=new")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1920,1080")
-
-    try:
-        service = Service("/tmp/chromedriver-mac-arm64/chromedriver")
-        driver = webdriver.Chrome(service=service, options=options)
-    except Exception as e:
-        pytest.skip(f"Chrome not available: {e}")
-
-    yield driver
-
-    driver.quit()
-
-
 class TestAddCardJourney:
     """Test adding cards through the app UI."""
 
-    def test_add_card_via_library_creates_localstorage(self, browser, streamlit_app):
+    def test_add_card_via_library_creates_localstorage(self, selenium_browser, streamlit_app, wait_for_app):
         """
         Journey: User adds card from library
         Expected: Card data should be saved to localStorage
@@ -73,32 +42,32 @@ class TestAddCardJourney:
         from selenium.webdriver.support.ui import Select
 
         # Clear localStorage first
-        browser.get(streamlit_app)
-        time.sleep(5)
-        browser.execute_script("localStorage.clear()")
-        browser.refresh()
+        selenium_browser.get(streamlit_app)
+        wait_for_app()
+        selenium_browser.execute_script("localStorage.clear()")
+        selenium_browser.refresh()
         time.sleep(5)
 
         # Verify localStorage is empty
-        before = browser.execute_script("return localStorage.getItem('churnpilot_cards')")
+        before = selenium_browser.execute_script("return localStorage.getItem('churnpilot_cards')")
         print(f"Before adding card: {before}")
 
         # Find and click the "Add Card" tab
         try:
-            tabs = browser.find_elements(By.CSS_SELECTOR, "[data-baseweb='tab']")
-            for tab in tabs:
-                if "Add" in tab.text:
-                    tab.click()
-                    print(f"Clicked tab: {tab.text}")
-                    time.sleep(3)
-                    break
+            # Match on text in the query itself: one lookup instead of a
+            # .text round-trip per tab
+            tabs = selenium_browser.find_elements(By.XPATH, "//*[@data-baseweb='tab'][contains(., 'Add')]")
+            if tabs:
+                tabs[0].click()
+                print(f"Clicked tab: {tabs[0].text}")
+                time.sleep(3)
         except Exception as e:
             print(f"Could not find Add Card tab: {e}")
 
         # Try to find and interact with the card library dropdown
         try:
             # Look for selectbox elements
-            selectboxes = browser.find_elements(By.CSS_SELECTOR, "[data-testid='stSelectbox']")
+            selectboxes = selenium_browser.find_elements(By.CSS_SELECTOR, "[data-testid='stSelectbox']")
             print(f"Found {len(selectboxes)} selectboxes")
 
             if selectboxes:
@@ -107,7 +76,7 @@ class TestAddCardJourney:
                 time.sleep(1)
 
                 # Try to select an option
-                options = browser.find_elements(By.CSS_SELECTOR, "[data-testid='stSelectboxOption']")
+                options = selenium_browser.find_elements(By.CSS_SELECTOR, "[data-testid='stSelectboxOption']")
                 print(f"Found {len(options)} options")
 
                 if len(options) > 1:
@@ -121,11 +90,11 @@ class TestAddCardJourney:
         time.sleep(5)
 
         # Check localStorage after interaction
-        after = browser.execute_script("return localStorage.getItem('churnpilot_cards')")
+        after = selenium_browser.execute_script("return localStorage.getItem('churnpilot_cards')")
         print(f"After interaction: {after}")
 
         # Check console logs
-        logs = browser.get_log('browser')
+        logs = selenium_browser.get_log('browser')
         churnpilot_logs = [log for log in logs if 'ChurnPilot' in str(log)]
         print(f"ChurnPilot logs: {churnpilot_logs}")
 
@@ -133,13 +102,13 @@ class TestAddCardJourney:
 class TestPersistenceJourney:
     """Test that data persists across page refreshes."""
 
-    def test_manually_set_data_persists_after_refresh(self, browser, streamlit_app):
+    def test_manually_set_data_persists_after_refresh(self, selenium_browser, streamlit_app, wait_for_app):
         """
         Journey: Set data in localStorage, refresh, verify it's still there
         This tests that the app doesn't CLEAR localStorage on load.
         """
-        browser.get(streamlit_app)
-        time.sleep(5)
+        selenium_browser.get(streamlit_app)
+        wait_for_app()
 
         # Set test data directly
         test_card = {
@@ -150,23 +119,23 @@ class TestPersistenceJourney:
             "credits": [],
             "created_at": "2024-01-01T00:00:00"
         }
-        browser.execute_script(
-            f"localStorage.setItem('churnpilot_cards', JSON.stringify([{json.dumps(test_card)}]))"
+        selenium_browser.execute_script(
+            "localStorage.setItem(arguments[0], arguments[1])", "churnpilot_cards", json.dumps([test_card])
         )
 
         # Verify it's set
-        before = browser.execute_script("return localStorage.getItem('churnpilot_cards')")
+        before = selenium_browser.execute_script("return localStorage.getItem('churnpilot_cards')")
         assert before is not None
         before_parsed = json.loads(before)
         assert len(before_parsed) == 1
         print(f"[OK] Set localStorage: {before_parsed[0]['name']}")
 
         # Refresh the page (this runs the app which might overwrite localStorage)
-        browser.refresh()
+        selenium_browser.refresh()
         time.sleep(8)  # Wait for app to fully load
 
         # Check if data persists
-        after = browser.execute_script("return localStorage.getItem('churnpilot_cards')")
+        after = selenium_browser.execute_script("return localStorage.getItem('churnpilot_cards')")
         print(f"After refresh: {after}")
 
         assert after is not None, "localStorage was cleared after refresh!"
@@ -175,12 +144,12 @@ class TestPersistenceJourney:
         assert after_parsed[0]['name'] == "Test Persistence Card", f"Wrong card: {after_parsed}"
         print(f"[OK] Data persists after refresh: {after_parsed[0]['name']}")
 
-    def test_multiple_cards_persist(self, browser, streamlit_app):
+    def test_multiple_cards_persist(self, selenium_browser, streamlit_app, wait_for_app):
         """
         Journey: Set multiple cards, refresh, all should persist
         """
-        browser.get(streamlit_app)
-        time.sleep(5)
+        selenium_browser.get(streamlit_app)
+        wait_for_app()
 
         # Set multiple test cards
         test_cards = [
@@ -188,16 +157,16 @@ class TestPersistenceJourney:
             {"id": "multi-2", "name": "Card Two", "issuer": "Bank B", "annual_fee": 95, "credits": [], "created_at": "2024-01-02T00:00:00"},
             {"id": "multi-3", "name": "Card Three", "issuer": "Bank C", "annual_fee": 550, "credits": [], "created_at": "2024-01-03T00:00:00"},
         ]
-        browser.execute_script(
-            f"localStorage.setItem('churnpilot_cards', JSON.stringify({json.dumps(test_cards)}))"
+        selenium_browser.execute_script(
+            "localStorage.setItem(arguments[0], arguments[1])", "churnpilot_cards", json.dumps(test_cards)
         )
 
         # Refresh
-        browser.refresh()
+        selenium_browser.refresh()
         time.sleep(8)
 
         # Verify all cards persist
-        after = browser.execute_script("return localStorage.getItem('churnpilot_cards')")
+        after = selenium_browser.execute_script("return localStorage.getItem('churnpilot_cards')")
         assert after is not None, "localStorage cleared!"
         after_parsed = json.loads(after)
         assert len(after_parsed) == 3, f"Expected 3 cards, got {len(after_parsed)}: {after_parsed}"
@@ -207,18 +176,18 @@ class TestPersistenceJourney:
 class TestAppSaveMechanism:
     """Test the app's internal save mechanism."""
 
-    def test_direct_js_execution_works(self, browser, streamlit_app):
+    def test_direct_js_execution_works(self, selenium_browser, streamlit_app, wait_for_app):
         """
         Test that direct JavaScript execution (not innerHTML) works.
         Our app uses st.components.v1.html which renders in iframes,
         not innerHTML injection. This test verifies the browser can
         execute JavaScript that modifies localStorage.
         """
-        browser.get(streamlit_app)
-        time.sleep(5)
+        selenium_browser.get(streamlit_app)
+        wait_for_app()
 
         # Direct JavaScript execution (this is what actually happens in our app's iframes)
-        browser.execute_script("""
+        selenium_browser.execute_script("""
             try {
                 localStorage.setItem('test_direct_js', JSON.stringify({success: true, timestamp: Date.now()}));
                 console.log('[Test] Direct JS execution worked');
@@ -230,22 +199,22 @@ class TestAppSaveMechanism:
         time.sleep(1)
 
         # Check if it worked
-        result = browser.execute_script("return localStorage.getItem('test_direct_js')")
+        result = selenium_browser.execute_script("return localStorage.getItem('test_direct_js')")
         assert result is not None, "Direct JS execution didn't work!"
         parsed = json.loads(result)
         assert parsed['success'] == True
         print(f"[OK] Direct JS execution works correctly")
 
-    def test_streamlit_component_renders(self, browser, streamlit_app):
+    def test_streamlit_component_renders(self, selenium_browser, streamlit_app, wait_for_app):
         """
         Check that Streamlit components (iframes) are present.
         The save mechanism uses st.components.v1.html which creates an iframe.
         """
-        browser.get(streamlit_app)
-        time.sleep(5)
+        selenium_browser.get(streamlit_app)
+        wait_for_app()
 
         # Count iframes
-        iframes = browser.find_elements("tag name", "iframe")
+        iframes = selenium_browser.find_elements("tag name", "iframe")
         print(f"Found {len(iframes)} iframes on page")
 
         # Check for any with our save script
@@ -261,27 +230,27 @@ class TestAppSaveMechanism:
 class TestConsoleLogging:
     """Test that console logs show save operations."""
 
-    def test_console_shows_save_logs(self, browser, streamlit_app):
+    def test_console_shows_save_logs(self, selenium_browser, streamlit_app, wait_for_app):
         """
         After the app loads and syncs, console should show save logs.
         """
-        browser.get(streamlit_app)
-        time.sleep(5)
+        selenium_browser.get(streamlit_app)
+        wait_for_app()
 
         # Set some data to trigger a sync on next page load
-        browser.execute_script("""
+        selenium_browser.execute_script("""
             localStorage.setItem('churnpilot_cards', JSON.stringify([
                 {id: 'log-test', name: 'Log Test Card', issuer: 'Test', annual_fee: 0, credits: []}
             ]));
         """)
 
         # Refresh to trigger app load
-        browser.refresh()
+        selenium_browser.refresh()
         time.sleep(8)
 
         # Get browser console logs
         try:
-            logs = browser.get_log('browser')
+            logs = selenium_browser.get_log('browser')
             all_logs = [log['message'] for log in logs]
             print(f"Browser logs ({len(all_logs)} total):")
             for log in all_logs[-20:]:  # Last 20 logs
@@ -294,12 +263,12 @@ class TestConsoleLogging:
 class TestDataIntegrity:
     """Test that data integrity is maintained."""
 
-    def test_complex_card_data_persists(self, browser, streamlit_app):
+    def test_complex_card_data_persists(self, selenium_browser, streamlit_app, wait_for_app):
         """
         Test that complex card data with all fields persists correctly.
         """
-        browser.get(streamlit_app)
-        time.sleep(5)
+        selenium_browser.get(streamlit_app)
+        wait_for_app()
 
         # Create a complex card with all fields
         complex_card = {
@@ -329,16 +298,16 @@ class TestDataIntegrity:
             "created_at": "2024-01-15T10:30:00"
         }
 
-        browser.execute_script(
-            f"localStorage.setItem('churnpilot_cards', JSON.stringify([{json.dumps(complex_card)}]))"
+        selenium_browser.execute_script(
+            "localStorage.setItem(arguments[0], arguments[1])", "churnpilot_cards", json.dumps([complex_card])
         )
 
         # Refresh
-        browser.refresh()
+        selenium_browser.refresh()
         time.sleep(8)
 
         # Verify complex data integrity
-        after = browser.execute_script("return localStorage.getItem('churnpilot_cards')")
+        after = selenium_browser.execute_script("return localStorage.getItem('churnpilot_cards')")
         assert after is not None, "Data lost!"
 
         after_parsed = json.loads(after)
@@ -357,38 +326,38 @@ class TestDataIntegrity:
 class TestEdgeCases:
     """Test edge cases and error scenarios."""
 
-    def test_empty_storage_doesnt_crash(self, browser, streamlit_app):
+    def test_empty_storage_doesnt_crash(self, selenium_browser, streamlit_app, wait_for_app):
         """App should handle empty localStorage gracefully."""
-        browser.get(streamlit_app)
-        time.sleep(3)
+        selenium_browser.get(streamlit_app)
+        wait_for_app()
 
         # Clear everything
-        browser.execute_script("localStorage.clear()")
+        selenium_browser.execute_script("localStorage.clear()")
 
         # Refresh
-        browser.refresh()
+        selenium_browser.refresh()
         time.sleep(8)
 
         # App should load without errors
         # Check for error elements
-        errors = browser.find_elements("css selector", ".stException, .stError")
+        errors = selenium_browser.find_elements("css selector", ".stException, .stError")
         assert len(errors) == 0, f"Found {len(errors)} error elements on page"
         print("[OK] App handles empty localStorage")
 
-    def test_invalid_json_doesnt_crash(self, browser, streamlit_app):
+    def test_invalid_json_doesnt_crash(self, selenium_browser, streamlit_app, wait_for_app):
         """App should handle invalid JSON in localStorage gracefully."""
-        browser.get(streamlit_app)
-        time.sleep(3)
+        selenium_browser.get(streamlit_app)
+        wait_for_app()
 
         # Set invalid JSON
-        browser.execute_script("localStorage.setItem('churnpilot_cards', 'not valid json {')")
+        selenium_browser.execute_script("localStorage.setItem('churnpilot_cards', 'not valid json {')")
 
         # Refresh
-        browser.refresh()
+        selenium_browser.refresh()
         time.sleep(8)
 
         # App should load without crashing
-        errors = browser.find_elements("css selector", ".stException")
+        errors = selenium_browser.find_elements("css selector", ".stException")
         # Some warning is OK, but no crash
         print(f"[OK] App handles invalid JSON (found {len(errors)} exception elements)")
 
@@ -396,15 +365,15 @@ class TestEdgeCases:
 class TestSaveTimingDebug:
     """Debug tests to understand save timing."""
 
-    def test_save_script_content(self, browser, streamlit_app):
+    def test_save_script_content(self, selenium_browser, streamlit_app, wait_for_app):
         """
         Examine what save scripts look like in the DOM.
         """
-        browser.get(streamlit_app)
-        time.sleep(8)
+        selenium_browser.get(streamlit_app)
+        wait_for_app()
 
         # Look for script elements
-        scripts = browser.execute_script("""
+        scripts = selenium_browser.execute_script("""
             var scripts = document.querySelectorAll('script');
             var results = [];
             scripts.forEach(function(s) {
@@ -419,21 +388,21 @@ class TestSaveTimingDebug:
         for i, script in enumerate(scripts[:5]):
             print(f"  Script {i}: {script}...")
 
-    def test_iframe_content(self, browser, streamlit_app):
+    def test_iframe_content(self, selenium_browser, streamlit_app, wait_for_app):
         """
         Check iframe contents for save scripts.
         Streamlit components render in iframes.
         """
-        browser.get(streamlit_app)
-        time.sleep(8)
+        selenium_browser.get(streamlit_app)
+        wait_for_app()
 
-        iframes = browser.find_elements("tag name", "iframe")
+        iframes = selenium_browser.find_elements("tag name", "iframe")
         print(f"Checking {len(iframes)} iframes for save scripts...")
 
         for i, iframe in enumerate(iframes[:10]):
             try:
-                browser.switch_to.frame(iframe)
-                scripts = browser.execute_script("""
+                selenium_browser.switch_to.frame(iframe)
+                scripts = selenium_browser.execute_script("""
                     var scripts = document.querySelectorAll('script');
                     var results = [];
                     scripts.forEach(function(s) {
@@ -445,9 +414,9 @@ class TestSaveTimingDebug:
                 """)
                 if scripts:
                     print(f"  iframe {i}: Found {len(scripts)} localStorage scripts")
-                browser.switch_to.default_content()
+                selenium_browser.switch_to.default_content()
             except Exception as e:
-                browser.switch_to.default_content()
+                selenium_browser.switch_to.default_content()
                 pass
 
 